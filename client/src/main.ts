@@ -35,12 +35,29 @@ interface RAGResult {
   similarity: number;
 }
 
+interface AudioStream {
+  mediaSource: MediaSource;
+  sourceBuffer: SourceBuffer | null;
+  pending: Uint8Array[];
+  done: boolean;
+}
+
+// Binary audio frames: opcode byte, big-endian uint32 stream id, then MP3 bytes
+const AUDIO_FRAME_OPCODE = 0x01;
+const AUDIO_FRAME_HEADER_SIZE = 5;
+
+// Progressive MP3 playback; browsers without it get each stream as one clip
+const STREAMING_AUDIO_SUPPORTED =
+  typeof MediaSource !== 'undefined' && MediaSource.isTypeSupported('audio/mpeg');
+
 // --- Main Application ---
 
 class OutputMediaApp {
   private serverWs: WebSocket | null = null;
   private recallWs: WebSocket | null = null;
-  private audioQueue: string[] = [];
+  private audioQueue: string[] = [];  // Object URLs, played in order
+  private audioStreams = new Map<number, AudioStream>();
+  private bufferedAudio = new Map<number, Uint8Array[]>();  // Fallback when streaming is unsupported
   private isPlaying = false;
   private projectId: string;
   private botId: string | null;
@@ -96,6 +113,7 @@ class OutputMediaApp {
       const url = this.getServerWsUrl();
       console.log('Connecting to server:', url);
       this.serverWs = new WebSocket(url);
+      this.serverWs.binaryType = 'arraybuffer';
 
       this.serverWs.onopen = () => {
         console.log('Server WebSocket connected');
@@ -103,7 +121,15 @@ class OutputMediaApp {
       };
 
       this.serverWs.onmessage = (event) => {
-        this.handleServerMessage(JSON.parse(event.data));
+        if (event.data instanceof ArrayBuffer) {
+          this.handleServerFrame(event.data);
+        } else {
+          // Messages queued together on the server arrive as one array
+          const parsed: WSMessage | WSMessage[] = JSON.parse(event.data);
+          for (const msg of Array.isArray(parsed) ? parsed : [parsed]) {
+            this.handleServerMessage(msg);
+          }
+        }
       };
 
       this.serverWs.onclose = () => {
@@ -215,10 +241,10 @@ class OutputMediaApp {
         );
         break;
 
-      case 'audio':
-        // Queue audio for playback
-        if (msg.data.audio) {
-          this.queueAudio(msg.data.audio as string);
+      case 'audio_chunk':
+        // End of a streamed response; its audio arrived as binary frames
+        if (msg.data.done) {
+          this.handleAudioChunk(msg.data.stream_id as number, null, true);
         }
         break;
 
@@ -242,13 +268,80 @@ class OutputMediaApp {
 
   // --- Audio Playback ---
 
-  private queueAudio(base64Audio: string): void {
-    this.audioQueue.push(base64Audio);
+  private queueAudioUrl(audioUrl: string): void {
+    this.audioQueue.push(audioUrl);
     if (!this.isPlaying) {
       this.playNextAudio();
     }
   }
 
+  private handleServerFrame(frame: ArrayBuffer): void {
+    const view = new DataView(frame);
+    if (frame.byteLength < AUDIO_FRAME_HEADER_SIZE || view.getUint8(0) !== AUDIO_FRAME_OPCODE) {
+      console.log('Unknown binary frame');
+      return;
+    }
+    // Part of a streamed response; playback starts with the first chunk
+    this.handleAudioChunk(view.getUint32(1), new Uint8Array(frame, AUDIO_FRAME_HEADER_SIZE), false);
+  }
+
+  private handleAudioChunk(streamId: number, chunk: Uint8Array | null, done: boolean): void {
+    if (!STREAMING_AUDIO_SUPPORTED) {
+      const chunks = this.bufferedAudio.get(streamId) ?? [];
+      if (chunk) chunks.push(chunk);
+      if (done) {
+        this.bufferedAudio.delete(streamId);
+        if (chunks.length > 0) {
+          this.queueAudioUrl(URL.createObjectURL(new Blob(chunks, { type: 'audio/mp3' })));
+        }
+      } else {
+        this.bufferedAudio.set(streamId, chunks);
+      }
+      return;
+    }
+
+    let stream = this.audioStreams.get(streamId);
+    if (!stream) {
+      // A stream that ends before any audio would never play or finish
+      if (!chunk) return;
+      stream = this.openAudioStream();
+      this.audioStreams.set(streamId, stream);
+    }
+
+    if (chunk) stream.pending.push(chunk);
+    if (done) {
+      stream.done = true;
+      this.audioStreams.delete(streamId);
+    }
+    this.flushAudioStream(stream);
+  }
+
+  private openAudioStream(): AudioStream {
+    const mediaSource = new MediaSource();
+    const stream: AudioStream = { mediaSource, sourceBuffer: null, pending: [], done: false };
+
+    // The source opens once the queued URL is attached to an Audio element
+    mediaSource.addEventListener('sourceopen', () => {
+      stream.sourceBuffer = mediaSource.addSourceBuffer('audio/mpeg');
+      stream.sourceBuffer.addEventListener('updateend', () => this.flushAudioStream(stream));
+      this.flushAudioStream(stream);
+    }, { once: true });
+
+    this.queueAudioUrl(URL.createObjectURL(mediaSource));
+    return stream;
+  }
+
+  private flushAudioStream(stream: AudioStream): void {
+    const { mediaSource, sourceBuffer } = stream;
+    if (!sourceBuffer || sourceBuffer.updating) return;
+
+    if (stream.pending.length > 0) {
+      sourceBuffer.appendBuffer(stream.pending.shift()!);
+    } else if (stream.done && mediaSource.readyState === 'open') {
+      mediaSource.endOfStream();
+    }
+  }
+
   private async playNextAudio(): Promise<void> {
     if (this.audioQueue.length === 0) {
       this.isPlaying = false;
@@ -256,18 +349,9 @@ class OutputMediaApp {
     }
 
     this.isPlaying = true;
-    const base64Audio = this.audioQueue.shift()!;
+    const audioUrl = this.audioQueue.shift()!;
 
     try {
-      // Decode base64 to binary
-      const binaryString = atob(base64Audio);
-      const bytes = new Uint8Array(binaryString.length);
-      for (let i = 0; i < binaryString.length; i++) {
-        bytes[i] = binaryString.charCodeAt(i);
-      }
-
-      const blob = new Blob([bytes], { type: 'audio/mp3' });
-      const audioUrl = URL.createObjectURL(blob);
       const audio = new Audio(audioUrl);
 
       this.showSpeaking(true);
@@ -289,6 +373,7 @@ class OutputMediaApp {
     } catch (error) {
       console.error('Failed to play audio:', error);
       this.showSpeaking(false);
+      URL.revokeObjectURL(audioUrl);
       this.playNextAudio();
     }
   }
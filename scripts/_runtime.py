@@ -0,0 +1,7 @@
+"""Event loop runner shared by the CLI scripts."""
+try:
+    from uvloop import run as run_async
+except ImportError:  # uvloop comes with uvicorn[standard], except on Windows
+    from asyncio import run as run_async
+
+__all__ = ["run_async"]
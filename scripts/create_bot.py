@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 """CLI script to create a Recall bot for a meeting."""
 import argparse
-import asyncio
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from _runtime import run_async
 from server.recall import get_recall_client
 from server.config import get_settings
 
@@ -66,7 +66,7 @@ def main():
 
     args = parser.parse_args()
 
-    asyncio.run(create_bot(
+    run_async(create_bot(
         args.meeting_url,
         args.project_id,
         args.bot_name,
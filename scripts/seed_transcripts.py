@@ -1,4 +1,6 @@
 """Seed sample transcripts for testing RAG functionality with recurring meeting isolation."""
+import asyncio
+import re
 import sys
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -7,9 +9,10 @@ import numpy as np
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from openai import OpenAI
+from _runtime import run_async
+from openai import AsyncOpenAI
 from server.config import get_settings
-from server.rag.engine import VectorCache, Chunk
+from server.rag.engine import VectorCache, ChunkMeta, get_cache_path
 
 # Sample meeting transcripts with recurring_meeting_id for isolation testing
 # Meetings with the same recurring_meeting_id share context; different IDs are isolated
@@ -90,60 +93,94 @@ CFO: Agreed. I'll prepare the financial analysis by end of week.
 ]
 
 
-def seed_recurring_meeting(recurring_meeting_id: str, meetings: list):
-    """Seed transcripts for a specific recurring meeting series."""
+# Non-blank transcript line, without surrounding whitespace
+_LINE_RE = re.compile(r"\S[^\n]*\S|\S")
+
+# Max inputs per embeddings request
+EMBEDDING_BATCH_SIZE = 256
+
+# Max embeddings requests in flight at once
+EMBEDDING_CONCURRENCY = 2
+
+
+def chunk_transcript(transcript: str) -> list[str]:
+    """Split a transcript into chunks of ~3 lines."""
+    lines = _LINE_RE.findall(transcript)
+    return [" ".join(lines[i:i+3]) for i in range(0, len(lines), 3)]
+
+
+async def embed_texts(openai: AsyncOpenAI, texts: list[str]) -> np.ndarray:
+    """Embed texts in concurrent batches, returning one (N, d) float32 matrix in input order."""
     settings = get_settings()
-    openai = OpenAI(api_key=settings.openai_api_key)
+    semaphore = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+    matrix: np.ndarray | None = None
+
+    async def embed_batch(start: int, batch: list[str]) -> None:
+        nonlocal matrix
+        async with semaphore:
+            response = await openai.embeddings.create(
+                model=settings.openai_embedding_model,
+                input=batch,
+            )
+        if matrix is None:
+            matrix = np.empty((len(texts), len(response.data[0].embedding)), dtype=np.float32)
+        # Scatter rows to their input position instead of sorting and stacking batches
+        for item in response.data:
+            matrix[start + item.index] = item.embedding
+
+    await asyncio.gather(*(
+        embed_batch(start, texts[start:start + EMBEDDING_BATCH_SIZE])
+        for start in range(0, len(texts), EMBEDDING_BATCH_SIZE)
+    ))
+    return matrix
 
-    cache_path = Path(settings.data_dir) / "meetings" / recurring_meeting_id / "vectors.json"
+
+async def seed_recurring_meeting(
+    recurring_meeting_id: str,
+    meetings: list,
+    meeting_chunks: list[list[str]],
+    embeddings: np.ndarray,
+):
+    """Seed transcripts for a specific recurring meeting series.
+
+    `meeting_chunks[i]` holds the chunks of `meetings[i]`, and `embeddings` holds
+    their rows in the same order.
+    """
+    cache_path = get_cache_path(recurring_meeting_id)
     cache = VectorCache(project_id=recurring_meeting_id)
 
     print(f"\nSeeding recurring meeting: {recurring_meeting_id}")
     print(f"Cache path: {cache_path}")
 
-    for meeting in meetings:
+    row = 0
+    for meeting, chunks in zip(meetings, meeting_chunks):
         print(f"  Processing: {meeting['title']} ({meeting['date'].strftime('%Y-%m-%d')})...")
 
-        # Chunk the transcript
-        lines = [line.strip() for line in meeting["transcript"].strip().split("\n") if line.strip()]
-
-        # Group into chunks of ~3-4 lines
-        chunks = []
-        for i in range(0, len(lines), 3):
-            chunk_text = " ".join(lines[i:i+3])
-            chunks.append(chunk_text)
-
-        # Get embeddings
-        response = openai.embeddings.create(
-            model=settings.openai_embedding_model,
-            input=chunks,
+        # Append this meeting's rows of the batch matrix in one shot
+        cache.add_chunks(
+            [
+                ChunkMeta(
+                    bot_id=meeting["bot_id"],
+                    text=text,
+                    meeting_title=meeting["title"],
+                    meeting_date=meeting["date"],
+                    recurring_meeting_id=recurring_meeting_id,
+                )
+                for text in chunks
+            ],
+            embeddings[row:row + len(chunks)],
         )
-
-        embeddings = [
-            np.array(item.embedding, dtype=np.float32)
-            for item in sorted(response.data, key=lambda x: x.index)
-        ]
-
-        # Create chunks with recurring_meeting_id
-        for text, emb in zip(chunks, embeddings):
-            cache.chunks.append(Chunk(
-                bot_id=meeting["bot_id"],
-                text=text,
-                embedding=emb,
-                meeting_title=meeting["title"],
-                meeting_date=meeting["date"],
-                recurring_meeting_id=recurring_meeting_id,
-            ))
+        row += len(chunks)
 
         cache.indexed_bots.add(meeting["bot_id"])
         print(f"    Added {len(chunks)} chunks")
 
-    # Save cache
-    cache.save(cache_path)
-    print(f"  Saved {len(cache.chunks)} total chunks")
+    # Save cache (each series writes its own files, so saves can run in parallel)
+    await asyncio.to_thread(cache.save, cache_path)
+    print(f"  Saved {len(cache)} chunks for {recurring_meeting_id}")
 
 
-def seed_all():
+async def seed_all():
     """Seed all sample meeting series."""
     print("=" * 60)
     print("Seeding sample transcripts with recurring meeting isolation")
@@ -162,9 +199,34 @@ def seed_all():
         else:
             isolated_meetings.append(meeting)
 
-    # Seed each meeting series
+    # Chunk every meeting up front so all series share batched embedding requests
+    chunks_by_series: dict[str, list[list[str]]] = {
+        recurring_id: [chunk_transcript(m["transcript"]) for m in meetings]
+        for recurring_id, meetings in meetings_by_series.items()
+    }
+    all_chunks = [
+        text
+        for meeting_chunks in chunks_by_series.values()
+        for chunks in meeting_chunks
+        for text in chunks
+    ]
+
+    settings = get_settings()
+    openai = AsyncOpenAI(api_key=settings.openai_api_key)
+    print(f"\nEmbedding {len(all_chunks)} chunks...")
+    embeddings = await embed_texts(openai, all_chunks) if all_chunks else np.empty((0, 0), dtype=np.float32)
+
+    # Seed every meeting series concurrently from its slice of the embedding matrix
+    seeds = []
+    offset = 0
     for recurring_id, meetings in meetings_by_series.items():
-        seed_recurring_meeting(recurring_id, meetings)
+        meeting_chunks = chunks_by_series[recurring_id]
+        count = sum(len(chunks) for chunks in meeting_chunks)
+        seeds.append(seed_recurring_meeting(
+            recurring_id, meetings, meeting_chunks, embeddings[offset:offset + count]
+        ))
+        offset += count
+    await asyncio.gather(*seeds)
 
     # Report isolated meetings (not seeded - they have no RAG context)
     if isolated_meetings:
@@ -191,4 +253,4 @@ if __name__ == "__main__":
         print("Each recurring_meeting_id gets its own isolated vector cache.")
         sys.exit(0)
 
-    seed_all()
+    run_async(seed_all())
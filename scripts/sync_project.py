@@ -1,12 +1,12 @@
 #!/usr/bin/env python3
 """CLI script to sync recurring meeting series index with Recall.ai."""
 import argparse
-import asyncio
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from _runtime import run_async
 from server.rag.engine import get_rag_engine
 from server.recall import get_recall_client
 
@@ -125,11 +125,11 @@ Examples:
     args = parser.parse_args()
 
     if args.list_series:
-        asyncio.run(list_meeting_series())
+        run_async(list_meeting_series())
     elif args.list_projects:
-        asyncio.run(list_projects())
+        run_async(list_projects())
     elif args.recurring_meeting_id:
-        asyncio.run(sync_recurring_meeting(args.recurring_meeting_id, args.force))
+        run_async(sync_recurring_meeting(args.recurring_meeting_id, args.force))
     else:
         parser.print_help()
 
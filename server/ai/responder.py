@@ -1,12 +1,24 @@
 """AI Responder - generates contextual responses using OpenAI."""
+import asyncio
+import contextlib
+import hashlib
 import logging
+import os
+import re
+import tempfile
+from collections import OrderedDict, deque
 from dataclasses import dataclass
-from typing import Optional
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import AsyncIterator, Optional
 
+import httpx
 from openai import AsyncOpenAI
 
 from server.config import get_settings
-from server.constants import WAKE_WORDS, BOT_NAME
+from server.constants import WAKE_WORDS, WAKE_WORDS_SET, WAKE_PHRASES, BOT_NAME
+from server.recall.client import HTTP2_AVAILABLE
 
 logger = logging.getLogger(__name__)
 
@@ -31,16 +43,135 @@ CRITICAL RULES:
 
 Your name is Recall. Speak in a friendly, helpful tone."""
 
+# Prebuilt system messages: the static rules are shared across calls, and the
+# per-turn context is filled into a fixed template with a single format call.
+_RULES_WITH_CONTEXT_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT_WITH_CONTEXT}
+_RULES_NO_CONTEXT_MESSAGE = {"role": "system", "content": SYSTEM_PROMPT_NO_CONTEXT}
+_CONTEXT_TEMPLATE = "=== MEETING CONTEXT ===\n{context}\n=== END CONTEXT ==="
+_ACTION_ITEMS_TEMPLATE = "Pending action items:\n{action_items}"
+
 GREETING_PROMPT = """You are "Recall", a friendly project bot.
 Introduce yourself in ONE short sentence. Mention that people can get your attention by saying "Recall".
 Do NOT mention any specific meetings or dates."""
 
+# Punctuation STT attaches to words ("Recall, ..." / "...recall?")
+_TOKEN_PUNCTUATION = ".,!?;:\"'"
+
+# Wake words as one alternation; longest first so "hey recall" wins over "recall"
+_WAKE_ALTERNATION = "|".join(map(re.escape, sorted(WAKE_WORDS, key=len, reverse=True)))
+
+# Everything that isn't part of a question: wake words, fillers, punctuation, whitespace
+_TRIM_RE = re.compile(rf"\b(?:{_WAKE_ALTERNATION}|hey|ok|okay|um|uh)\b|[,.\s]+")
+
+
+# Utterances longer than this are not scanned for wake words
+MAX_WAKE_SCAN_CHARS = 2000
+
+# Bytes per audio chunk forwarded while TTS is streaming
+TTS_STREAM_CHUNK_SIZE = 4096
+
+# Reply to a bare wake word
+WAKE_CONFIRMATION_TEXT = "Yes?"
+
+# Fixed phrases spoken often enough to keep their audio in memory
+_PINNED_TTS_PHRASES = frozenset({WAKE_CONFIRMATION_TEXT})
+_pinned_tts: dict[str, bytes] = {}
+
+# File names in the TTS disk cache, least recently used first. Built from mtimes on
+# the first store, then kept in step so stores don't rescan the directory.
+_tts_index: OrderedDict[str, None] | None = None
+
+
+@lru_cache
+def get_openai_client() -> AsyncOpenAI:
+    """Get the process-wide OpenAI client.
+
+    All sessions share one connection pool (HTTP/2 where h2 is installed), so
+    chat, TTS and embedding requests reuse kept-alive connections instead of
+    paying a TLS handshake each.
+    """
+    http_client = httpx.AsyncClient(
+        http2=HTTP2_AVAILABLE,  # Falls back to HTTP/1.1 keep-alive without the h2 package
+        limits=httpx.Limits(max_keepalive_connections=50, max_connections=200),
+        timeout=30.0,
+    )
+    return AsyncOpenAI(api_key=get_settings().openai_api_key, http_client=http_client)
+
+
+async def warm_openai_client() -> None:
+    """Open the shared client's connection with a cheap request, so the first
+    session's greeting and query embedding don't also pay for DNS, TCP and TLS setup."""
+    try:
+        await get_openai_client().models.retrieve("gpt-4o-mini")
+    except Exception as e:
+        logger.warning(f"OpenAI warmup failed: {e}")
+
+
+async def close_openai_client() -> None:
+    """Close the shared OpenAI client's connections, if it was created."""
+    if get_openai_client.cache_info().currsize:
+        await get_openai_client().close()
+        get_openai_client.cache_clear()
+
+
+def preload_pinned_tts() -> None:
+    """Load fixed phrases' audio from the TTS disk cache into memory."""
+    for text in _PINNED_TTS_PHRASES:
+        try:
+            _pinned_tts[text] = _tts_cache_path(text).read_bytes()
+        except OSError:
+            pass  # Synthesized and pinned on first use
+
+
+def _tts_cache_path(text: str) -> Path:
+    """Path of the cached MP3 for this text (keyed by model, voice and text)."""
+    key = hashlib.blake2b(f"tts-1:alloy:{text}".encode("utf-8"), digest_size=16).hexdigest()
+    return Path(get_settings().data_dir) / "tts_cache" / f"{key}.mp3"
+
+
+def _read_and_touch(path: Path) -> bytes:
+    """Read a cached file and bump its mtime, so recency survives restarts."""
+    audio = path.read_bytes()
+    os.utime(path)
+    return audio
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Replace `path` with `data` via a uniquely named temp file, so concurrent writers never share one."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+
+
+def _scan_tts_cache(cache_dir: Path) -> list[str]:
+    """Cached MP3 file names, least recently used first."""
+    entries = []
+    with os.scandir(cache_dir) as it:
+        for entry in it:
+            if entry.name.endswith(".mp3"):
+                try:
+                    entries.append((entry.stat().st_mtime, entry.name))
+                except OSError:
+                    pass  # Removed while scanning
+    return [name for _, name in sorted(entries)]
+
+
+def _unlink_files(cache_dir: Path, names: list[str]) -> None:
+    for name in names:
+        (cache_dir / name).unlink(missing_ok=True)
+
 
 @dataclass
 class AIResponse:
-    """Response containing text and optional audio."""
+    """Generated response text; its audio is streamed separately via stream_tts."""
     text: str
-    audio: Optional[bytes] = None
 
 
 class AIResponder:
@@ -48,8 +179,8 @@ class AIResponder:
 
     def __init__(self):
         self._settings = get_settings()
-        self._client = AsyncOpenAI(api_key=self._settings.openai_api_key)
-        self._conversation: list[dict] = []
+        self._client = get_openai_client()
+        self._conversation: deque[dict] = deque(maxlen=20)
         self._context: str = ""
         self._action_items: str = ""
         self._awaiting_question: bool = False
@@ -66,7 +197,7 @@ class AIResponder:
         """Get recent conversation for follow-up query expansion."""
         if not self._conversation:
             return ""
-        recent = self._conversation[-4:]
+        recent = reversed(list(islice(reversed(self._conversation), 4)))
         return " ".join(msg.get("content", "") for msg in recent)
 
     def add_user_message(self, speaker: str, text: str) -> None:
@@ -75,11 +206,16 @@ class AIResponder:
             "role": "user",
             "content": f"[{speaker}]: {text}"
         })
-        if len(self._conversation) > 20:
-            self._conversation = self._conversation[-20:]
 
     async def should_respond(self, text: str) -> bool:
         """Determine if the bot should respond to this utterance."""
+        # Too short to hold a wake word, or a monologue nobody addressed to the bot
+        n = len(text)
+        if n < 3 or n > MAX_WAKE_SCAN_CHARS:
+            awaiting = self._awaiting_question
+            self._awaiting_question = False
+            return awaiting and n > 3
+
         text_lower = text.lower().strip()
 
         # Check for follow-up after wake word
@@ -88,17 +224,15 @@ class AIResponder:
             if len(text_lower) > 3:
                 return True
 
-        # Check for wake word
-        has_wake_word = any(wake in text_lower for wake in WAKE_WORDS)
+        # Check for wake word: set lookup per token, substring check for phrases
+        has_wake_word = not WAKE_WORDS_SET.isdisjoint(
+            token.strip(_TOKEN_PUNCTUATION) for token in text_lower.split()
+        ) or any(phrase in text_lower for phrase in WAKE_PHRASES)
         if not has_wake_word:
             return False
 
         # Check if just wake word or wake word + question
-        remaining = text_lower
-        for wake in WAKE_WORDS:
-            remaining = remaining.replace(wake, "").strip()
-        for filler in [",", ".", "hey", "ok", "okay", "um", "uh"]:
-            remaining = remaining.replace(filler, "").strip()
+        remaining = _TRIM_RE.sub("", text_lower)
 
         if len(remaining) < 5:
             self._awaiting_question = True
@@ -114,19 +248,25 @@ class AIResponder:
         """Clear the awaiting flag."""
         self._awaiting_question = False
 
-    async def generate_response(self, include_audio: bool = True) -> AIResponse:
+    async def generate_response(self) -> AIResponse:
         """Generate response based on conversation history and context."""
         try:
+            # Static rules go first and never change, so OpenAI can reuse the cached
+            # prompt prefix; per-turn context follows in its own message.
             if self._context:
-                system_content = SYSTEM_PROMPT_WITH_CONTEXT
-                system_content += f"\n\n=== MEETING CONTEXT ===\n{self._context}\n=== END CONTEXT ==="
+                messages = [
+                    _RULES_WITH_CONTEXT_MESSAGE,
+                    {"role": "system", "content": _CONTEXT_TEMPLATE.format(context=self._context)},
+                ]
             else:
-                system_content = SYSTEM_PROMPT_NO_CONTEXT
+                messages = [_RULES_NO_CONTEXT_MESSAGE]
 
             if self._action_items:
-                system_content += f"\n\nPending action items:\n{self._action_items}"
+                messages.append({
+                    "role": "system",
+                    "content": _ACTION_ITEMS_TEMPLATE.format(action_items=self._action_items),
+                })
 
-            messages = [{"role": "system", "content": system_content}]
             messages.extend(self._conversation)
 
             response = await self._client.chat.completions.create(
@@ -140,11 +280,7 @@ class AIResponder:
             self._conversation.append({"role": "assistant", "content": text})
             self._context = ""
 
-            audio = None
-            if include_audio:
-                audio = await self._generate_tts(text)
-
-            return AIResponse(text=text, audio=audio)
+            return AIResponse(text=text)
 
         except Exception as e:
             logger.error(f"Response generation error: {e}")
@@ -172,23 +308,78 @@ class AIResponder:
             text = response.choices[0].message.content
             self._conversation.append({"role": "assistant", "content": text})
 
-            audio = await self._generate_tts(text)
-            return AIResponse(text=text, audio=audio)
+            return AIResponse(text=text)
 
         except Exception as e:
             logger.error(f"Greeting error: {e}")
             return AIResponse(text="Hello, I'm Recall, your meeting memory assistant.")
 
-    async def _generate_tts(self, text: str) -> Optional[bytes]:
-        """Convert text to speech using OpenAI TTS."""
+    async def stream_tts(self, text: str) -> AsyncIterator[bytes]:
+        """Yield MP3 audio for text as the TTS API produces it.
+
+        Cached audio is yielded in one piece; fully streamed audio is cached.
+        """
+        cache_path = _tts_cache_path(text)
+        audio = await self._read_cached_tts(text, cache_path)
+        if audio is not None:
+            yield audio
+            return
+
+        chunks: list[bytes] = []
         try:
-            response = await self._client.audio.speech.create(
+            async with self._client.audio.speech.with_streaming_response.create(
                 model="tts-1",
                 voice="alloy",
                 input=text,
                 response_format="mp3",
-            )
-            return response.content
+            ) as response:
+                async for chunk in response.iter_bytes(TTS_STREAM_CHUNK_SIZE):
+                    chunks.append(chunk)
+                    yield chunk
         except Exception as e:
-            logger.error(f"TTS error: {e}")
+            logger.error(f"TTS stream error: {e}")
+            return
+
+        audio = b"".join(chunks)
+        if text in _PINNED_TTS_PHRASES:
+            _pinned_tts[text] = audio
+        try:
+            await self._store_tts(cache_path, audio)
+        except OSError as e:
+            logger.warning(f"Failed to cache TTS audio: {e}")
+
+    async def _read_cached_tts(self, text: str, cache_path: Path) -> Optional[bytes]:
+        """Return cached audio and mark it recently used, or None on a miss."""
+        audio = _pinned_tts.get(text)
+        if audio is not None:
+            return audio
+        try:
+            audio = await asyncio.to_thread(_read_and_touch, cache_path)
+        except OSError:
             return None
+        if _tts_index is not None and cache_path.name in _tts_index:
+            _tts_index.move_to_end(cache_path.name)
+        if text in _PINNED_TTS_PHRASES:
+            _pinned_tts[text] = audio
+        return audio
+
+    async def _store_tts(self, cache_path: Path, audio: bytes) -> None:
+        """Atomically write audio to the cache, evicting least recently used files over the limit.
+
+        File I/O runs in a worker thread; the recency index lives in memory.
+        """
+        global _tts_index
+        cache_dir = cache_path.parent
+        await asyncio.to_thread(_write_atomic, cache_path, audio)
+
+        if _tts_index is None:
+            names = await asyncio.to_thread(_scan_tts_cache, cache_dir)
+            if _tts_index is None:  # Another store may have built it meanwhile
+                _tts_index = OrderedDict.fromkeys(names)
+        _tts_index[cache_path.name] = None
+        _tts_index.move_to_end(cache_path.name)
+
+        excess = len(_tts_index) - self._settings.tts_cache_max_files
+        if excess > 0:
+            evicted = [_tts_index.popitem(last=False)[0] for _ in range(excess)]
+            await asyncio.to_thread(_unlink_files, cache_dir, evicted)
@@ -1,5 +1,7 @@
 """Application configuration using pydantic-settings."""
 from functools import lru_cache
+from typing import Literal
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -19,6 +21,8 @@ class Settings(BaseSettings):
     # Recall.ai
     recall_api_key: str = ""
     recall_region: str = "us-west-2"
+    # Max Recall API requests in flight at once, across all callers
+    recall_max_concurrency: int = 8
 
     # Public URL for output media page (use ngrok URL for testing)
     client_url: str = "http://localhost:5173"
@@ -34,6 +38,13 @@ class Settings(BaseSettings):
     rag_top_k: int = 5
     chunk_size: int = 500
     chunk_overlap: int = 50
+    # Embedding storage: int8 keeps vectors quantized to 1 byte per dim in memory and on disk
+    rag_embedding_dtype: Literal["float32", "int8"] = "float32"
+    # Max bot transcripts fetched and embedded at once during index sync
+    rag_index_concurrency: int = 4
+
+    # Max cached TTS clips kept under data_dir/tts_cache
+    tts_cache_max_files: int = 500
 
 
 @lru_cache
@@ -10,10 +10,29 @@ WAKE_WORDS = (
     "hey recall", "ok recall", "okay recall",
 )
 
+# Single-word wake words for set lookup against punctuation-stripped tokens
+WAKE_WORDS_SET = frozenset(w.strip(",") for w in WAKE_WORDS if " " not in w)
+
+# Multi-word wake words that no single-word entry already covers
+WAKE_PHRASES = tuple(
+    w for w in WAKE_WORDS if " " in w and WAKE_WORDS_SET.isdisjoint(w.split())
+)
+
+# Words that carry no topic on their own; utterances made only of these
+# (acknowledgements, fillers, requests to repeat) skip the memory lookup
+SMALL_TALK_WORDS = frozenset({
+    "a", "again", "alright", "and", "appreciate", "awesome", "bye", "can", "cool", "could",
+    "did", "do", "does", "for", "get", "got", "great", "hello", "hey", "hi", "i", "is",
+    "it", "it's", "just", "me", "mm", "much", "nice", "no", "nope", "now", "oh", "ok",
+    "okay", "perfect", "please", "repeat", "right", "say", "so", "sorry", "sure", "thank",
+    "thanks", "that", "that's", "the", "this", "uh", "um", "understood", "very", "well",
+    "would", "yeah", "yep", "yes", "you",
+})
+
 # Leave command keywords
 LEAVE_KEYWORDS = ("leave", "go away", "exit", "bye", "goodbye", "go now", "depart")
 
-# Chat commands that trigger bot removal
+# Chat commands that trigger bot removal (casefolded, matched against the whole message)
 CHAT_REMOVE_COMMANDS = frozenset({"remove", "leave", "exit", "bye"})
 
 # Default message sent when bot joins meeting
@@ -1,16 +1,21 @@
 """Recall - Meeting Memory Bot"""
+import asyncio
 import logging
+from contextlib import asynccontextmanager
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, JSONResponse
 
+from server.ai.responder import close_openai_client, preload_pinned_tts, warm_openai_client
+from server.recall import close_recall_client
 from server.websocket_handler import OutputMediaHandler
 from server.routers import bots_router, projects_router, webhooks_router
-from server.state import active_bots, active_handlers, project_handlers
+from server.state import registry
 
 logging.basicConfig(
     level=logging.INFO,
@@ -18,10 +23,31 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (numpy values and datetimes serialize natively)."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm shared clients and fixed TTS phrases on startup; release connection pools on shutdown."""
+    preload_pinned_tts()
+    warmup = asyncio.create_task(warm_openai_client())
+    yield
+    warmup.cancel()
+    await close_openai_client()
+    await close_recall_client()
+
+
 app = FastAPI(
     title="Recall",
     description="Meeting memory bot with RAG",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -52,7 +78,7 @@ async def websocket_endpoint(
 ):
     """Output media WebSocket endpoint."""
     if not bot_id:
-        bot_id = active_bots.get(project_id)
+        bot_id = registry.active_bot(project_id)
 
     handler = OutputMediaHandler(
         websocket,
@@ -61,22 +87,14 @@ async def websocket_endpoint(
         bot_id=bot_id,
     )
 
-    # Always register by project_id (for bot creation to find us)
-    project_handlers[project_id] = handler
-
-    # Also register by bot_id if known
-    if bot_id:
-        active_handlers[bot_id] = handler
+    # Always register by project_id (for bot creation to find us), and by bot_id if known
+    registry.register(project_id, handler, bot_id)
 
     try:
         await handler.handle()
     finally:
-        if project_id in project_handlers:
-            del project_handlers[project_id]
         # Check handler's state for bot_id (may have been set after connection)
-        final_bot_id = handler._state.bot_id
-        if final_bot_id and final_bot_id in active_handlers:
-            del active_handlers[final_bot_id]
+        registry.unregister(project_id, handler, handler._state.bot_id)
 
 
 # Static files (client)
@@ -100,5 +118,8 @@ if CLIENT_DIST.exists():
 
 
 if __name__ == "__main__":
+    from importlib.util import find_spec
+
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop is installed everywhere but Windows, which keeps the asyncio loop
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop" if find_spec("uvloop") else "asyncio")
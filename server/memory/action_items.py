@@ -14,34 +14,116 @@ from datetime import datetime
 from typing import Optional, Iterator
 from functools import lru_cache
 
+try:
+    import hyperscan
+except ImportError:  # Optional: prefilters long transcripts with a SIMD multi-pattern scan
+    hyperscan = None
+
+from pydantic import TypeAdapter
+
 from server.models import ActionItem, ActionItemStatus
-from server.memory.persistence import get_action_items_path, load_json, save_json
+from server.memory.persistence import (
+    get_action_items_path,
+    get_action_items_journal_path,
+    load_bytes,
+    save_bytes,
+    load_jsonl,
+    append_jsonl,
+)
+
+# Saves with fewer changed items append to the journal instead of rewriting the snapshot
+JOURNAL_BATCH_MAX = 32
+# The journal is folded into the snapshot once it holds this many entries
+JOURNAL_MAX_ENTRIES = 256
+
+# Converts snapshots between JSON bytes and models in one pydantic-core call
+_ITEM_LIST_ADAPTER = TypeAdapter(list[ActionItem])
 
 
 @dataclass(frozen=True, slots=True)
 class ActionPattern:
-    """Compiled regex pattern for action item detection."""
+    """All action item patterns compiled into one alternation.
+
+    Each alternative captures its action text into its own named group, so
+    `match.lastgroup` tells which pattern fired.
+    """
     regex: re.Pattern
-    name: str
+    names: dict[str, str]  # capture group -> pattern name
+    triggers: Optional["hyperscan.Database"] = None  # Start offsets of candidate matches
 
 
-@lru_cache(maxsize=1)
-def _get_compiled_patterns() -> tuple[ActionPattern, ...]:
-    """Get pre-compiled patterns (cached for performance)."""
+def _compile_patterns() -> ActionPattern:
+    """Compile the action item pattern union (done once, at import)."""
+    # (trigger phrase, capture group, pattern name); the action text follows the trigger.
+    # Apostrophes also accept the typographic ’ that STT output often uses.
     patterns = [
-        (r"remind me (?:to|about) (.+?)(?:\.|$)", "remind me"),
-        (r"circle back (?:on|to) (.+?)(?:\.|$)", "circle back"),
-        (r"follow up (?:on|with) (.+?)(?:\.|$)", "follow up"),
-        (r"action item[:\s]+(.+?)(?:\.|$)", "action item"),
-        (r"don'?t forget (?:to )?(.+?)(?:\.|$)", "don't forget"),
-        (r"let'?s revisit (.+?)(?:\.|$)", "revisit"),
-        (r"todo[:\s]+(.+?)(?:\.|$)", "todo"),
+        (r"\bremind me (?:to|about) ", "remind_me", "remind me"),
+        (r"\bcircle back (?:on|to) ", "circle_back", "circle back"),
+        (r"\bfollow up (?:on|with) ", "follow_up", "follow up"),
+        (r"\baction item[:\s]+", "action_item", "action item"),
+        (r"\bdon['’]?t forget (?:to )?", "dont_forget", "don't forget"),
+        (r"\blet['’]?s revisit ", "revisit", "revisit"),
+        (r"\btodo[:\s]+", "todo", "todo"),
     ]
-    return tuple(
-        ActionPattern(re.compile(p, re.IGNORECASE), name)
-        for p, name in patterns
+
+    triggers = None
+    if hyperscan is not None:
+        triggers = hyperscan.Database()
+        triggers.compile(
+            expressions=[trigger.encode() for trigger, _, _ in patterns],
+            ids=list(range(len(patterns))),
+            elements=len(patterns),
+            flags=hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST | hyperscan.HS_FLAG_UTF8,
+        )
+
+    # The action text is a bounded run up to the end of the sentence or line. A negated
+    # class cannot overlap its terminator, so matching never backtracks.
+    return ActionPattern(
+        regex=re.compile(
+            "|".join(
+                rf"{trigger}(?P<{group}>[^.?!\n]{{5,400}})(?:[.?!\n]|$)"
+                for trigger, group, _ in patterns
+            ),
+            re.IGNORECASE,
+        ),
+        names={group: name for _, group, name in patterns},
+        triggers=triggers,
+    )
+
+
+_ACTION_PATTERN = _compile_patterns()
+
+
+def _iter_matches(pattern: ActionPattern, text: str) -> Iterator[re.Match]:
+    """Yield non-overlapping pattern matches, like `finditer`.
+
+    With hyperscan, one SIMD scan finds where trigger phrases start and the regex
+    only runs at those offsets. Offsets are byte positions, so this path is ASCII-only.
+    """
+    if pattern.triggers is None or not text.isascii():
+        yield from pattern.regex.finditer(text)
+        return
+
+    starts: set[int] = set()
+    pattern.triggers.scan(
+        text.encode("ascii"),
+        match_event_handler=lambda _id, start, _end, _flags, _ctx: starts.add(start),
+        scratch=hyperscan.Scratch(pattern.triggers),
     )
 
+    end = 0
+    for start in sorted(starts):
+        if start < end:
+            continue
+        if match := pattern.regex.match(text, start):
+            end = match.end()
+            yield match
+
+
+# Literal substrings, one of which every trigger phrase contains ("t forget" covers
+# don't / dont / don’t forget)
+_TRIGGER_LITERALS = ("remind me", "circle back", "follow up", "action item", "t forget", "revisit", "todo")
+
 
 # Patterns for extracting assignee from context
 _ASSIGNEE_PATTERN = re.compile(r"([A-Z][a-z]+)[,:]?\s*(?:can you|please|could you)")
@@ -57,32 +139,38 @@ def detect_action_items(
     """
     Detect action items in text using pattern matching.
 
-    Yields ActionItem objects for each detected phrase.
+    Yields ActionItem objects for each detected phrase, in one pass over the text.
     Deduplicates by normalized text within the same call.
     """
-    patterns = _get_compiled_patterns()
+    # Most transcripts contain no trigger phrase at all; skip the regex pass for them
+    text_lower = text.lower()
+    if not any(literal in text_lower for literal in _TRIGGER_LITERALS):
+        return
+
+    pattern = _ACTION_PATTERN
     seen_texts: set[str] = set()
 
-    for pattern in patterns:
-        for match in pattern.regex.finditer(text):
-            action_text = match.group(1).strip()
-
-            # Skip short or duplicate matches
-            if len(action_text) < 5 or action_text.lower() in seen_texts:
-                continue
-
-            seen_texts.add(action_text.lower())
-
-            yield ActionItem(
-                item_id=str(uuid.uuid4()),
-                project_id=project_id,
-                meeting_id=meeting_id,
-                text=action_text,
-                pattern_matched=pattern.name,
-                assignee=_extract_assignee(text, match.start()) or speaker,
-                status=ActionItemStatus.PENDING,
-                created_at=datetime.utcnow(),
-            )
+    for match in _iter_matches(pattern, text):
+        group = match.lastgroup
+        action_text = match.group(group).strip()
+        key = action_text.lower()
+
+        # Skip duplicate matches (the pattern already enforces a minimum length)
+        if key in seen_texts:
+            continue
+
+        seen_texts.add(key)
+
+        yield ActionItem(
+            item_id=str(uuid.uuid4()),
+            project_id=project_id,
+            meeting_id=meeting_id,
+            text=action_text,
+            pattern_matched=pattern.names[group],
+            assignee=_extract_assignee(text, match.start()) or speaker,
+            status=ActionItemStatus.PENDING,
+            created_at=datetime.utcnow(),
+        )
 
 
 def _extract_assignee(text: str, position: int) -> Optional[str]:
@@ -95,51 +183,79 @@ def _extract_assignee(text: str, position: int) -> Optional[str]:
     return match.group(1) if match else None
 
 
+def _dedup_key(text: str) -> int:
+    """Dedup key for item text.
+
+    The index is rebuilt on every load, so the per-process salt of hash() is harmless.
+    """
+    return hash(text.lower())
+
+
 class ActionItemStore:
     """
     In-memory store with JSON persistence for action items.
 
     Handles deduplication by text to avoid storing the same action item
     multiple times across transcript re-processing.
+
+    Small saves append changed items to a JSON-lines journal; the full
+    snapshot is only rewritten for large batches or when the journal grows.
     """
 
-    __slots__ = ("project_id", "_items", "_text_index", "_dirty")
+    __slots__ = ("project_id", "_items", "_text_index", "_dirty_ids", "_journal_entries")
 
     def __init__(self, project_id: str):
         self.project_id = project_id
         self._items: dict[str, ActionItem] = {}
-        self._text_index: set[str] = set()  # For deduplication
-        self._dirty = False
+        self._text_index: set[int] = set()  # Hashes of normalized text, for deduplication
+        self._dirty_ids: set[str] = set()
+        self._journal_entries = 0
 
     def load(self) -> None:
-        """Load items from disk."""
-        path = get_action_items_path(self.project_id)
-        data = load_json(path, default=[])
-        self._items = {
-            item["item_id"]: ActionItem.model_validate(item)
-            for item in data
-        }
-        self._text_index = {item.text.lower() for item in self._items.values()}
-        self._dirty = False
+        """Load the snapshot from disk and replay the journal on top of it."""
+        raw = load_bytes(get_action_items_path(self.project_id))
+        items = _ITEM_LIST_ADAPTER.validate_json(raw) if raw else []
+        journal = load_jsonl(get_action_items_journal_path(self.project_id))
+
+        self._items = {item.item_id: item for item in items}
+        for entry in journal:
+            if entry.get("op") == "upsert":
+                item = ActionItem.model_validate(entry["item"])
+                self._items[item.item_id] = item
+        self._text_index = {_dedup_key(item.text) for item in self._items.values()}
+        self._dirty_ids = set()
+        self._journal_entries = len(journal)
 
     def save(self) -> None:
-        """Save items to disk if modified."""
-        if not self._dirty:
+        """Save modified items to disk."""
+        if not self._dirty_ids:
             return
-        path = get_action_items_path(self.project_id)
-        data = [item.model_dump(mode="json") for item in self._items.values()]
-        save_json(path, data)
-        self._dirty = False
+
+        new_entries = self._journal_entries + len(self._dirty_ids)
+        if len(self._dirty_ids) < JOURNAL_BATCH_MAX and new_entries <= JOURNAL_MAX_ENTRIES:
+            append_jsonl(get_action_items_journal_path(self.project_id), [
+                {"op": "upsert", "item": self._items[item_id].model_dump(mode="json")}
+                for item_id in self._dirty_ids
+            ])
+            self._journal_entries = new_entries
+        else:
+            # Snapshot first, so a crash before the unlink only replays entries it already holds
+            path = get_action_items_path(self.project_id)
+            save_bytes(path, _ITEM_LIST_ADAPTER.dump_json(list(self._items.values())))
+            get_action_items_journal_path(self.project_id).unlink(missing_ok=True)
+            self._journal_entries = 0
+
+        self._dirty_ids.clear()
 
     def add(self, item: ActionItem) -> bool:
         """Add item if not duplicate. Returns True if added."""
-        key = item.text.lower()
+        key = _dedup_key(item.text)
         if key in self._text_index:
             return False
 
         self._items[item.item_id] = item
         self._text_index.add(key)
-        self._dirty = True
+        self._dirty_ids.add(item.item_id)
         return True
 
     def add_many(self, items: Iterator[ActionItem]) -> int:
@@ -158,24 +274,28 @@ class ActionItemStore:
         """Get pending items for surfacing."""
         return self.get_by_status(ActionItemStatus.PENDING)
 
+    def has_pending(self) -> bool:
+        """Whether any item is still pending."""
+        return any(item.status == ActionItemStatus.PENDING for item in self._items.values())
+
     def mark_surfaced(self, item_ids: list[str]) -> None:
         """Mark items as surfaced (mentioned in a meeting)."""
         now = datetime.utcnow()
         for item_id in item_ids:
             if item := self._items.get(item_id):
-                self._items[item_id] = ActionItem(
-                    **{**item.model_dump(), "status": ActionItemStatus.SURFACED, "surfaced_at": now}
+                self._items[item_id] = item.model_copy(
+                    update={"status": ActionItemStatus.SURFACED, "surfaced_at": now}
                 )
-                self._dirty = True
+                self._dirty_ids.add(item_id)
 
     def complete(self, item_id: str) -> Optional[ActionItem]:
         """Mark item as completed."""
         if item := self._items.get(item_id):
-            updated = ActionItem(
-                **{**item.model_dump(), "status": ActionItemStatus.COMPLETED, "completed_at": datetime.utcnow()}
+            updated = item.model_copy(
+                update={"status": ActionItemStatus.COMPLETED, "completed_at": datetime.utcnow()}
             )
             self._items[item_id] = updated
-            self._dirty = True
+            self._dirty_ids.add(item_id)
             return updated
         return None
 
@@ -188,16 +308,12 @@ class ActionItemStore:
 
 # --- Store Registry ---
 
-_stores: dict[str, ActionItemStore] = {}
-
-
+@lru_cache(maxsize=None)
 def get_action_item_store(project_id: str) -> ActionItemStore:
     """Get or create action item store for project."""
-    if project_id not in _stores:
-        store = ActionItemStore(project_id)
-        store.load()
-        _stores[project_id] = store
-    return _stores[project_id]
+    store = ActionItemStore(project_id)
+    store.load()
+    return store
 
 
 # --- Convenience Functions ---
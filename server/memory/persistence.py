@@ -1,10 +1,11 @@
 """Simple JSON persistence for local cache data."""
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from functools import lru_cache
 
+import orjson
+
 from server.config import get_settings
 
 
@@ -22,16 +23,46 @@ def get_action_items_path(project_id: str) -> Path:
     return get_project_dir(project_id) / "action_items.json"
 
 
-def load_json(file_path: Path, default=None):
-    """Load JSON from file."""
+def get_action_items_journal_path(project_id: str) -> Path:
+    """Get path to the action_items.jsonl change journal for a project."""
+    return get_project_dir(project_id) / "action_items.jsonl"
+
+
+def load_bytes(file_path: Path) -> bytes | None:
+    """Load raw file contents, or None if the file does not exist."""
+    try:
+        return file_path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def save_bytes(file_path: Path, data: bytes) -> None:
+    """Atomically replace a file in an existing directory with `data`."""
+    tmp_path = file_path.with_suffix(file_path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(file_path)
+
+
+def load_jsonl(file_path: Path) -> list:
+    """Load records from a JSON-lines file, skipping lines torn by an interrupted write."""
     if not file_path.exists():
-        return default if default is not None else {}
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+        return []
+    records = []
+    for line in file_path.read_bytes().splitlines():
+        try:
+            records.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            continue
+    return records
 
 
-def save_json(file_path: Path, data) -> None:
-    """Save data to JSON file."""
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, indent=2, default=str)
+def append_jsonl(file_path: Path, records: list) -> None:
+    """Append records to a JSON-lines file in a single write."""
+    data = b"".join(orjson.dumps(r, default=str) + b"\n" for r in records)
+    with open(file_path, "ab+") as f:
+        # Start on a fresh line if a previous append was torn
+        if f.tell():
+            f.seek(-1, 2)
+            if f.read(1) != b"\n":
+                data = b"\n" + data
+        f.write(data)
@@ -51,7 +51,7 @@ class BotCreateResponse(BaseModel):
 
 class WSMessageType(str, Enum):
     """WebSocket message types."""
-    AUDIO = "audio"
+    AUDIO_CHUNK = "audio_chunk"  # End of a streamed audio clip; its chunks arrive as binary frames
     TRANSCRIPT = "transcript"
     CONTEXT = "context"
     ACTION_ITEMS = "action_items"
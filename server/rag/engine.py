@@ -2,18 +2,22 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import mmap as mmap_module
+import os
+import pickle
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
+import orjson
 from numpy.typing import NDArray
-from openai import OpenAI
 
 from server.config import get_settings
+from server.ai.responder import get_openai_client
 from server.recall.client import get_recall_client, RecallClient, BotInfo
 from server.memory.action_items import (
     detect_action_items,
@@ -23,13 +27,26 @@ from server.memory.action_items import (
 
 logger = logging.getLogger(__name__)
 
+# Embedding sidecars larger than this are memory-mapped instead of read into RAM
+MMAP_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+# Sentence boundaries for chunking: whitespace after terminal punctuation
+_SENT_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_NEWLINES_TO_SPACES = str.maketrans("\n", " ")
+
+# (meeting URL substring, title template), checked in order
+_MEETING_TITLE_TEMPLATES = (
+    ("zoom", "Zoom Meeting ({date})"),
+    ("meet.google", "Google Meet ({date})"),
+    ("teams", "Teams Meeting ({date})"),
+)
+
 
 @dataclass(slots=True)
-class Chunk:
-    """Embedded text chunk from a meeting transcript."""
+class ChunkMeta:
+    """Metadata for an embedded transcript chunk (its vector is a row of VectorCache.embeddings)."""
     bot_id: str
     text: str
-    embedding: NDArray[np.float32]
     meeting_title: str
     meeting_date: datetime
     recurring_meeting_id: str | None = None
@@ -45,25 +62,76 @@ class SearchResult:
     similarity: float
     recurring_meeting_id: str | None = None
 
+    def to_thinking_dict(self) -> dict:
+        """Compact form shown in the client's context visualization."""
+        return {
+            "text": self.text,
+            "meeting": self.meeting_title,
+            "date": _display_date(self.meeting_date),
+            "similarity": round(self.similarity, 2),
+        }
+
+
+@lru_cache(maxsize=1024)
+def _display_date(meeting_date: datetime) -> str:
+    """Short display date; results from one meeting share a single formatted string."""
+    return meeting_date.strftime("%b %d, %Y")
+
 
 @dataclass
 class VectorCache:
-    """In-memory vector cache with disk persistence."""
+    """In-memory vector cache with disk persistence.
+
+    Embeddings live in one contiguous (N, d) float32 matrix of unit-length rows, so
+    cosine similarity is a single matrix-vector product; `meta[i]` describes row i.
+    The matrix is a view of a buffer grown by doubling, so appends copy only new rows.
+
+    With `dtype` "int8" rows are held as int8 with a float32 scale per row instead
+    (a quarter of the memory), searched with an integer dot product, and saved as is.
+    """
     project_id: str
-    chunks: list[Chunk] = field(default_factory=list)
+    meta: list[ChunkMeta] = field(default_factory=list)
     indexed_bots: set[str] = field(default_factory=set)
-    _matrix: NDArray[np.float32] | None = field(default=None, repr=False)
+    dtype: str = field(default_factory=lambda: get_settings().rag_embedding_dtype)
+    _buffer: NDArray | None = field(default=None, init=False, repr=False)
+    _scales: NDArray[np.float32] | None = field(default=None, init=False, repr=False)
 
-    def add_chunks(self, new_chunks: list[Chunk]) -> None:
-        self.chunks.extend(new_chunks)
-        self._matrix = None
+    def __len__(self) -> int:
+        return len(self.meta)
+
+    @property
+    def embeddings(self) -> NDArray[np.float32] | None:
+        """Float32 embedding matrix (dequantized for int8 caches)."""
+        if self._buffer is None:
+            return None
+        n = len(self.meta)
+        if self.dtype == "int8":
+            return _dequantize_int8(self._buffer[:n], self._scales[:n])
+        return self._buffer[:n]
+
+    def add_chunks(self, meta: list[ChunkMeta], embeddings: NDArray[np.float32]) -> None:
+        """Append chunks and their (len(meta), d) embedding rows, normalized to unit length."""
+        if not meta:
+            return
+        embeddings = _normalize_rows(np.asarray(embeddings, dtype=np.float32))
+        n = len(self.meta)
+
+        if self.dtype == "int8":
+            embeddings, scales = _quantize_int8(embeddings)
+            self._scales = _append_rows(self._scales, n, scales)
+        self._buffer = _append_rows(self._buffer, n, embeddings)
+        self.meta.extend(meta)
+
+    def _adopt_rows(self, meta: list[ChunkMeta], rows: NDArray, scales: NDArray[np.float32] | None) -> None:
+        """Take saved rows (and int8 scales) in this cache's dtype as is, without renormalizing."""
+        self._buffer = rows
+        self._scales = scales
+        self.meta = list(meta)
 
     def get_matrix(self) -> NDArray[np.float32] | None:
-        if not self.chunks:
+        if not self.meta:
             return None
-        if self._matrix is None:
-            self._matrix = np.vstack([c.embedding for c in self.chunks])
-        return self._matrix
+        return self.embeddings
 
     def search(
         self,
@@ -72,98 +140,297 @@ class VectorCache:
         threshold: float = 0.65,
     ) -> list[SearchResult]:
         """Cosine similarity search."""
-        matrix = self.get_matrix()
-        if matrix is None:
-            return []
+        return self._results(*self._rank(query_embedding, top_k, threshold))
 
-        query_norm = np.linalg.norm(query_embedding)
-        chunk_norms = np.linalg.norm(matrix, axis=1)
-        similarities = (matrix @ query_embedding) / (chunk_norms * query_norm + 1e-10)
+    def search_with_vectors(
+        self,
+        query_embedding: NDArray[np.float32],
+        top_k: int = 5,
+        threshold: float = 0.65,
+    ) -> tuple[list[SearchResult], NDArray[np.float32]]:
+        """Search, also returning the matched rows' unit embeddings (one row per result)."""
+        indices, similarities = self._rank(query_embedding, top_k, threshold)
+        if self._buffer is None:
+            return [], np.empty((0, len(query_embedding)), dtype=np.float32)
+        return self._results(indices, similarities), self.rows(indices)
+
+    def rows(self, indices: NDArray[np.intp]) -> NDArray[np.float32]:
+        """Float32 embedding rows at the given indices (dequantized for int8 caches)."""
+        if self._buffer is None:
+            return np.empty((0, 0), dtype=np.float32)
+        if self.dtype == "int8":
+            return _dequantize_int8(self._buffer[indices], self._scales[indices])
+        return self._buffer[indices]
+
+    def _rank(
+        self,
+        query_embedding: NDArray[np.float32],
+        top_k: int,
+        threshold: float,
+    ) -> tuple[NDArray[np.intp], NDArray[np.float32]]:
+        """Indices of the top_k rows at or above threshold, best first, and all similarities."""
+        if not self.meta:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+
+        n = len(self.meta)
+        query = np.asarray(query_embedding, dtype=np.float32)
+        query = query / (np.linalg.norm(query) + 1e-10)
+
+        if self.dtype == "int8":
+            query_q8, query_scale = _quantize_int8(query[np.newaxis])
+            dots = np.einsum("ij,j->i", self._buffer[:n], query_q8[0], dtype=np.int32)
+            similarities = dots * (self._scales[:n] * query_scale[0])
+        else:
+            similarities = self._buffer[:n] @ query
 
         indices = np.where(similarities >= threshold)[0]
         if len(indices) == 0:
-            return []
+            return indices, similarities
 
-        top_indices = indices[np.argsort(similarities[indices])[-top_k:][::-1]]
+        # Select the top k in linear time, then sort only those
+        candidate_sims = similarities[indices]
+        if len(indices) > top_k:
+            part = np.argpartition(candidate_sims, -top_k)[-top_k:]
+            indices, candidate_sims = indices[part], candidate_sims[part]
+        return indices[np.argsort(candidate_sims)[::-1]], similarities
 
+    def _results(self, top_indices: NDArray[np.intp], similarities: NDArray[np.float32]) -> list[SearchResult]:
         return [
             SearchResult(
-                text=self.chunks[i].text,
-                bot_id=self.chunks[i].bot_id,
-                meeting_title=self.chunks[i].meeting_title,
-                meeting_date=self.chunks[i].meeting_date,
+                text=self.meta[i].text,
+                bot_id=self.meta[i].bot_id,
+                meeting_title=self.meta[i].meeting_title,
+                meeting_date=self.meta[i].meeting_date,
                 similarity=float(similarities[i]),
-                recurring_meeting_id=self.chunks[i].recurring_meeting_id,
+                recurring_meeting_id=self.meta[i].recurring_meeting_id,
             )
             for i in top_indices
         ]
 
     def save(self, path: Path) -> None:
+        """Write chunk metadata to `path` (JSON) and the embedding matrix to a .npy sidecar."""
         data = {
+            "dtype": self.dtype,
             "indexed_bots": list(self.indexed_bots),
             "chunks": [
                 {
-                    "bot_id": c.bot_id,
-                    "text": c.text,
-                    "embedding": c.embedding.tolist(),
-                    "meeting_title": c.meeting_title,
-                    "meeting_date": c.meeting_date.isoformat(),
-                    "recurring_meeting_id": c.recurring_meeting_id,
+                    "bot_id": m.bot_id,
+                    "text": m.text,
+                    "meeting_title": m.meeting_title,
+                    "meeting_date": m.meeting_date,
+                    "recurring_meeting_id": m.recurring_meeting_id,
                 }
-                for c in self.chunks
+                for m in self.meta
             ],
         }
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w") as f:
-            json.dump(data, f)
+
+        # Matrix first, metadata last: a crash in between leaves the old metadata,
+        # whose row count no longer matches and is discarded on load.
+        n = len(self.meta)
+        if not n:
+            matrix = np.empty((0, 0), dtype=np.float32)
+        elif self.dtype == "int8":
+            matrix = self._buffer[:n]
+            _save_npy(path.with_suffix(".scales.npy"), self._scales[:n])
+        else:
+            matrix = self._buffer[:n]
+        _save_npy(path.with_suffix(".npy"), matrix)
+
+        json_tmp = path.with_name(path.name + ".tmp")
+        json_tmp.write_bytes(orjson.dumps(data))
+        os.replace(json_tmp, path)
+
+        # Written last and tied to the exact files above; any later change to them
+        # (or a crash before this) leaves a fingerprint mismatch, so it is ignored
+        snapshot_tmp = path.with_name(path.name + ".pkl.tmp")
+        snapshot_tmp.write_bytes(pickle.dumps(
+            (_cache_fingerprint(path), self.dtype, list(self.indexed_bots), self.meta),
+            protocol=5,
+        ))
+        os.replace(snapshot_tmp, path.with_suffix(".pkl"))
 
     @classmethod
-    def load(cls, project_id: str, path: Path) -> "VectorCache":
+    def load(cls, project_id: str, path: Path, mmap: bool | None = None) -> "VectorCache":
+        """Load a cache saved by `save`.
+
+        Metadata comes from the pickled snapshot when it was written for the current
+        JSON and sidecars, skipping JSON and date parsing. The embedding sidecar is
+        memory-mapped read-only when `mmap` is True, or when it is None and the file
+        exceeds MMAP_THRESHOLD_BYTES.
+        """
         cache = cls(project_id=project_id)
         if not path.exists():
             return cache
 
         try:
-            with open(path) as f:
-                data = json.load(f)
-
-            cache.indexed_bots = set(data.get("indexed_bots", []))
-            cache.chunks = [
-                Chunk(
-                    bot_id=c["bot_id"],
-                    text=c["text"],
-                    embedding=np.array(c["embedding"], dtype=np.float32),
-                    meeting_title=c["meeting_title"],
-                    meeting_date=datetime.fromisoformat(c["meeting_date"]),
-                    recurring_meeting_id=c.get("recurring_meeting_id"),
+            snapshot = _load_meta_snapshot(path)
+            legacy = False
+            embeddings = None
+
+            if snapshot is not None:
+                file_dtype, indexed_bots, meta = snapshot
+            else:
+                # Parse straight from the page cache instead of copying the file into a bytes object
+                with open(path, "rb") as f, mmap_module.mmap(f.fileno(), 0, access=mmap_module.ACCESS_READ) as mapped:
+                    with memoryview(mapped) as view:
+                        data = orjson.loads(view)
+
+                chunks = data.get("chunks", [])
+                legacy = bool(chunks) and "embedding" in chunks[0]
+                if legacy:
+                    # Legacy format with embeddings inline in the JSON; popping each float list
+                    # once copied keeps peak memory near one parsed file rather than two
+                    embeddings = np.empty((len(chunks), len(chunks[0]["embedding"])), dtype=np.float32)
+                    for i, c in enumerate(chunks):
+                        embeddings[i] = c.pop("embedding")
+
+                file_dtype = data.get("dtype")
+                indexed_bots = data.get("indexed_bots", [])
+                meta = [
+                    ChunkMeta(
+                        bot_id=c["bot_id"],
+                        text=c["text"],
+                        meeting_title=c["meeting_title"],
+                        meeting_date=datetime.fromisoformat(c["meeting_date"]),
+                        recurring_meeting_id=c.get("recurring_meeting_id"),
+                    )
+                    for c in chunks
+                ]
+
+            if not meta:
+                embeddings = np.empty((0, 0), dtype=np.float32)
+            elif embeddings is None:
+                npy_path = path.with_suffix(".npy")
+                if mmap is None:
+                    mmap = npy_path.stat().st_size > MMAP_THRESHOLD_BYTES
+                embeddings = np.load(npy_path, mmap_mode="r" if mmap else None)
+                if file_dtype == "int8":
+                    # Older caches stored float16 scales
+                    scales = np.load(path.with_suffix(".scales.npy")).astype(np.float32, copy=False)
+                    if len(scales) != len(embeddings):
+                        logger.warning(f"Vector cache {path} has mismatched int8 scales, ignoring")
+                        return cache
+
+            if len(embeddings) != len(meta):
+                logger.warning(
+                    f"Vector cache {path} has {len(meta)} chunks but {len(embeddings)} embeddings; "
+                    f"starting from an empty index"
                 )
-                for c in data.get("chunks", [])
-            ]
+                return cache
+
+            cache.indexed_bots = set(indexed_bots)
+            if meta and not legacy and (file_dtype or "float32") == cache.dtype:
+                # Stored rows are already unit-length (and quantized for int8): take them as is
+                cache._adopt_rows(meta, embeddings, scales if file_dtype == "int8" else None)
+            elif meta:
+                if file_dtype == "int8":
+                    embeddings = _dequantize_int8(embeddings, scales)
+                cache.add_chunks(meta, embeddings)
         except Exception as e:
             logger.warning(f"Failed to load vector cache: {e}")
+            return cache
+
+        if legacy:
+            # Rewrite once so later loads skip parsing floats out of JSON
+            try:
+                cache.save(path)
+                logger.info(f"Migrated vector cache {path} to a .npy sidecar")
+            except OSError as e:
+                logger.warning(f"Failed to migrate vector cache {path}: {e}")
 
         return cache
 
 
+def _load_meta_snapshot(path: Path) -> tuple[str | None, list[str], list[ChunkMeta]] | None:
+    """Load the (dtype, indexed_bots, meta) snapshot written by `VectorCache.save`.
+
+    Returns None when it is missing, unreadable, or was written for other versions
+    of the JSON and sidecar files than those on disk.
+    """
+    snapshot_path = path.with_suffix(".pkl")
+    try:
+        snapshot = pickle.loads(snapshot_path.read_bytes())
+        if len(snapshot) != 4 or snapshot[0] != _cache_fingerprint(path):
+            logger.info(f"Vector cache snapshot {snapshot_path} is stale, loading from JSON")
+            return None
+        return snapshot[1:]
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable vector cache snapshot {snapshot_path}: {e}")
+        return None
+
+
+def _cache_fingerprint(path: Path) -> tuple:
+    """(size, mtime_ns) of the cache JSON and its sidecars; None for missing files."""
+    fingerprint = []
+    for file_path in (path, path.with_suffix(".npy"), path.with_suffix(".scales.npy")):
+        try:
+            st = file_path.stat()
+            fingerprint.append((st.st_size, st.st_mtime_ns))
+        except FileNotFoundError:
+            fingerprint.append(None)
+    return tuple(fingerprint)
+
+
+def _normalize_rows(matrix: NDArray[np.float32]) -> NDArray[np.float32]:
+    """Scale rows to unit length, returning `matrix` itself if they already are."""
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    # OpenAI embeddings come normalized; skipping the copy keeps memory-mapped caches on disk
+    if np.allclose(norms, 1.0, atol=1e-4):
+        return matrix
+    return matrix / np.maximum(norms, 1e-10)
+
+
+def _append_rows(buffer: NDArray | None, n: int, rows: NDArray) -> NDArray:
+    """Write `rows` after the first `n` rows of `buffer`, doubling its capacity when full.
+
+    An empty buffer adopts `rows` without copying (keeps loaded memory maps on disk).
+    """
+    if buffer is None or n == 0:
+        return rows
+    new_n = n + len(rows)
+    if new_n > len(buffer) or not buffer.flags.writeable:
+        grown = np.empty((max(new_n, 2 * len(buffer)), *buffer.shape[1:]), dtype=buffer.dtype)
+        grown[:n] = buffer[:n]
+        buffer = grown
+    buffer[n:new_n] = rows
+    return buffer
+
+
+def _save_npy(path: Path, array: NDArray) -> None:
+    """Atomically write an array to a .npy file."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "wb") as f:
+        np.save(f, array)
+    os.replace(tmp_path, path)
+
+
+def _quantize_int8(matrix: NDArray[np.float32]) -> tuple[NDArray[np.int8], NDArray[np.float32]]:
+    """Quantize rows to int8 with a per-row scale, so that row ~= q8 * scale."""
+    scales = np.abs(matrix).max(axis=1) / 127
+    q8 = np.round(matrix / np.maximum(scales, 1e-10)[:, np.newaxis]).astype(np.int8)
+    return q8, scales.astype(np.float32)
+
+
+def _dequantize_int8(q8: NDArray[np.int8], scales: NDArray) -> NDArray[np.float32]:
+    """Rebuild a float32 matrix from `_quantize_int8` output."""
+    return q8.astype(np.float32) * scales.astype(np.float32).reshape(-1, 1)
+
+
 class RAGEngine:
     """RAG engine for a recurring meeting series."""
 
-    __slots__ = ("recurring_meeting_id", "_settings", "_openai", "_cache", "_recall", "_lock")
+    __slots__ = ("recurring_meeting_id", "_settings", "_cache", "_recall", "_lock")
 
     def __init__(self, recurring_meeting_id: str):
         self.recurring_meeting_id = recurring_meeting_id
         self._settings = get_settings()
-        self._openai: OpenAI | None = None
         self._recall: RecallClient | None = None
         self._cache: VectorCache | None = None
         self._lock = asyncio.Lock()
 
-    @property
-    def openai(self) -> OpenAI:
-        if self._openai is None:
-            self._openai = OpenAI(api_key=self._settings.openai_api_key)
-        return self._openai
-
     @property
     def recall(self) -> RecallClient:
         if self._recall is None:
@@ -177,41 +444,40 @@ class RAGEngine:
         return self._cache
 
     def _cache_path(self) -> Path:
-        return Path(self._settings.data_dir) / "meetings" / self.recurring_meeting_id / "vectors.json"
+        return get_cache_path(self.recurring_meeting_id)
 
-    def _get_embedding(self, text: str) -> NDArray[np.float32]:
-        response = self.openai.embeddings.create(
-            model=self._settings.openai_embedding_model,
-            input=text,
-        )
-        return np.array(response.data[0].embedding, dtype=np.float32)
-
-    def _get_embeddings_batch(self, texts: list[str]) -> list[NDArray[np.float32]]:
+    async def _get_embeddings_batch(self, texts: list[str]) -> NDArray[np.float32]:
+        """Embed texts, returning a (len(texts), d) matrix in input order."""
         if not texts:
-            return []
-        response = self.openai.embeddings.create(
+            return np.empty((0, 0), dtype=np.float32)
+        response = await get_openai_client().embeddings.create(
             model=self._settings.openai_embedding_model,
             input=texts,
         )
-        return [
-            np.array(item.embedding, dtype=np.float32)
-            for item in sorted(response.data, key=lambda x: x.index)
-        ]
+        # Scatter rows by their response index (0 <= index < len(texts)) instead of sorting
+        matrix = np.empty((len(texts), len(response.data[0].embedding)), dtype=np.float32)
+        for item in response.data:
+            matrix[item.index] = item.embedding
+        return matrix
 
     def _chunk_text(self, text: str, chunk_size: int = 500) -> list[str]:
         """Split text into chunks at sentence boundaries."""
-        sentences = re.split(r"(?<=[.!?])\s+", text.replace("\n", " ").strip())
-        sentences = [s.strip() for s in sentences if s.strip()]
+        # Splitting the stripped text on whitespace runs leaves no padding to strip
+        sentences = _SENT_SPLIT.split(text.translate(_NEWLINES_TO_SPACES).strip())
 
         chunks = []
         current = []
         current_len = 0
 
         for sentence in sentences:
+            if not sentence:
+                continue
+
             if current_len + len(sentence) > chunk_size and current:
                 chunks.append(" ".join(current))
-                current = current[-1:] if current else []
-                current_len = sum(len(s) for s in current)
+                # Keep the last sentence as overlap for context continuity
+                current = current[-1:]
+                current_len = len(current[0])
 
             current.append(sentence)
             current_len += len(sentence)
@@ -236,48 +502,54 @@ class RAGEngine:
             if not to_index:
                 return {"indexed": 0, "total_bots": len(bots)}
 
-            indexed = 0
-            for bot in to_index:
-                try:
-                    await self._index_bot(bot)
-                    indexed += 1
-                except Exception as e:
-                    logger.error(f"Failed to index bot {bot.id}: {e}")
+            # Transcript fetches and embedding calls are I/O bound; overlap a bounded number
+            semaphore = asyncio.Semaphore(max(1, self._settings.rag_index_concurrency))
+
+            async def index_one(bot: BotInfo) -> int:
+                async with semaphore:
+                    try:
+                        await self._index_bot(bot)
+                        return 1
+                    except Exception as e:
+                        logger.error(f"Failed to index bot {bot.id}: {e}")
+                        return 0
+
+            indexed = sum(await asyncio.gather(*(index_one(b) for b in to_index)))
 
             self.cache.save(self._cache_path())
             return {"indexed": indexed, "total_bots": len(bots)}
 
     async def _index_bot(self, bot: BotInfo) -> None:
         """Index a single bot's transcript."""
-        utterances = await self.recall.fetch_transcript(bot.transcript_url)
-        if not utterances:
+        lines = [
+            f"{u.speaker_name or 'Speaker'}: {u.text}"
+            async for u in self.recall.iter_transcript(bot.transcript_url)
+        ]
+        if not lines:
             return
 
-        full_text = "\n".join(
-            f"{u.speaker_name or 'Speaker'}: {u.text}" for u in utterances
-        )
+        full_text = "\n".join(lines)
 
         chunks = self._chunk_text(full_text)
         if not chunks:
             return
 
-        embeddings = self._get_embeddings_batch(chunks)
+        embeddings = await self._get_embeddings_batch(chunks)
         meeting_title = self._extract_meeting_title(bot)
         meeting_date = bot.created_at or datetime.utcnow()
 
-        new_chunks = [
-            Chunk(
+        new_meta = [
+            ChunkMeta(
                 bot_id=bot.id,
                 text=text,
-                embedding=emb,
                 meeting_title=meeting_title,
                 meeting_date=meeting_date,
                 recurring_meeting_id=self.recurring_meeting_id,
             )
-            for text, emb in zip(chunks, embeddings)
+            for text in chunks
         ]
 
-        self.cache.add_chunks(new_chunks)
+        self.cache.add_chunks(new_meta, embeddings)
         self.cache.indexed_bots.add(bot.id)
 
         # Extract action items
@@ -287,14 +559,11 @@ class RAGEngine:
         action_store.save()
 
     def _extract_meeting_title(self, bot: BotInfo) -> str:
-        date_str = bot.created_at.strftime('%b %d') if bot.created_at else 'Unknown'
-
-        if "zoom" in bot.meeting_url.lower():
-            return f"Zoom Meeting ({date_str})"
-        elif "meet.google" in bot.meeting_url.lower():
-            return f"Google Meet ({date_str})"
-        elif "teams" in bot.meeting_url.lower():
-            return f"Teams Meeting ({date_str})"
+        url = bot.meeting_url.lower()
+        for platform, template in _MEETING_TITLE_TEMPLATES:
+            if platform in url:
+                date_str = bot.created_at.strftime('%b %d') if bot.created_at else 'Unknown'
+                return template.format(date=date_str)
         return bot.bot_name or "Meeting"
 
     async def query(
@@ -308,11 +577,36 @@ class RAGEngine:
         if auto_sync:
             await self.sync_index()
 
-        threshold = threshold or self._settings.rag_similarity_threshold
-        query_embedding = self._get_embedding(query)
+        return self.search(await self.embed(query), top_k=top_k, threshold=threshold)
 
+    async def embed(self, text: str) -> NDArray[np.float32]:
+        """Embed a query over the shared (warmed) OpenAI connection pool."""
+        response = await get_openai_client().embeddings.create(
+            model=self._settings.openai_embedding_model,
+            input=text,
+        )
+        return np.array(response.data[0].embedding, dtype=np.float32)
+
+    def search(
+        self,
+        query_embedding: NDArray[np.float32],
+        top_k: int = 5,
+        threshold: float = None,
+    ) -> list[SearchResult]:
+        """Search the index with an already computed query embedding."""
+        threshold = threshold or self._settings.rag_similarity_threshold
         return self.cache.search(query_embedding, top_k=top_k, threshold=threshold)
 
+    def search_with_vectors(
+        self,
+        query_embedding: NDArray[np.float32],
+        top_k: int = 5,
+        threshold: float = None,
+    ) -> tuple[list[SearchResult], NDArray[np.float32]]:
+        """Search, also returning each result's unit embedding for local re-ranking."""
+        threshold = threshold or self._settings.rag_similarity_threshold
+        return self.cache.search_with_vectors(query_embedding, top_k=top_k, threshold=threshold)
+
     def format_context(self, results: list[SearchResult]) -> str:
         """Format search results as context for LLM."""
         if not results:
@@ -326,6 +620,10 @@ class RAGEngine:
 
         return "\n".join(lines)
 
+    def has_pending_action_items(self) -> bool:
+        """Whether the series has pending action items."""
+        return get_action_item_store(self.recurring_meeting_id).has_pending()
+
     def get_action_items_context(self) -> str:
         """Get pending action items for prompt injection."""
         store = get_action_item_store(self.recurring_meeting_id)
@@ -333,13 +631,20 @@ class RAGEngine:
         return format_action_items_for_prompt(pending)
 
 
-_engines: dict[str, RAGEngine] = {}
+@lru_cache(maxsize=256)
+def get_cache_path(recurring_meeting_id: str) -> Path:
+    """Path of the vector cache for a recurring meeting series."""
+    return Path(get_settings().data_dir) / "meetings" / recurring_meeting_id / "vectors.json"
 
 
 def get_rag_engine(recurring_meeting_id: str | None) -> RAGEngine | None:
     """Get or create RAG engine. Returns None if no recurring_meeting_id."""
     if not recurring_meeting_id:
         return None
-    if recurring_meeting_id not in _engines:
-        _engines[recurring_meeting_id] = RAGEngine(recurring_meeting_id)
-    return _engines[recurring_meeting_id]
+    return _get_engine(recurring_meeting_id)
+
+
+@lru_cache(maxsize=None)
+def _get_engine(recurring_meeting_id: str) -> RAGEngine:
+    """One engine per recurring meeting series."""
+    return RAGEngine(recurring_meeting_id)
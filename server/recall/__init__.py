@@ -2,6 +2,7 @@
 from server.recall.client import (
     RecallClient,
     get_recall_client,
+    close_recall_client,
     BotInfo,
     TranscriptUtterance,
 )
@@ -9,6 +10,7 @@ from server.recall.client import (
 __all__ = [
     "RecallClient",
     "get_recall_client",
+    "close_recall_client",
     "BotInfo",
     "TranscriptUtterance",
 ]
@@ -1,17 +1,65 @@
 """Recall.ai API Client."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from importlib.util import find_spec
 from datetime import datetime
 from typing import AsyncIterator
 from dataclasses import dataclass
 
 import httpx
+import orjson
+
+try:
+    import ijson
+except ImportError:  # Optional: transcripts are then parsed in one piece instead of streamed
+    ijson = None
 
 from server.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Per-bot lookups are reused for this long; download URLs on them are presigned
+MEDIA_URL_TTL_SEC = 300.0
+BOT_TERMINAL_TTL_SEC = 300.0
+# Live bots change status during a meeting, so their lookups go stale quickly
+BOT_LIVE_TTL_SEC = 10.0
+LOOKUP_CACHE_MAX = 1024
+
+TERMINAL_BOT_STATUSES = frozenset({"done", "call_ended", "error", "fatal"})
+
+# HTTP/2 needs the h2 package (httpx[http2]); ALPN falls back to HTTP/1.1 per server
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Shared fallback for missing nested API objects; read-only
+_EMPTY: dict = {}
+
+# Static parts of every create_bot payload; shared across requests, never mutated
+_RECORDING_CONFIG = {
+    "transcript": {
+        "provider": {
+            "recallai_streaming": {
+                "mode": "prioritize_low_latency",
+                "language_code": "en",
+            }
+        },
+        "diarization": {
+            "use_separate_streams_when_available": True,
+        },
+    },
+}
+_AUTOMATIC_LEAVE = {
+    "waiting_room_timeout": 600,
+    "noone_joined_timeout": 600,
+    "everyone_left_timeout": 3,
+    "silence_detection": {
+        "timeout": 3600,
+        "activate_after": 300,
+    },
+}
+
 
 @dataclass(frozen=True, slots=True)
 class TranscriptUtterance:
@@ -38,49 +86,81 @@ class BotInfo:
 
     @classmethod
     def from_api(cls, data: dict) -> "BotInfo":
-        metadata = data.get("metadata", {}) or {}
-        recording = data.get("recording") or {}
-        media_shortcuts = recording.get("media_shortcuts") or {}
-        transcript_info = media_shortcuts.get("transcript") or {}
-
-        created_at = None
-        if created_str := data.get("created_at"):
-            try:
-                created_at = datetime.fromisoformat(created_str.replace("Z", "+00:00"))
-            except (ValueError, TypeError):
-                pass
-
-        meeting_url = data.get("meeting_url", "")
+        get = data.get
+        metadata = get("metadata") or _EMPTY
+        recording = get("recording") or _EMPTY
+        transcript_info = (recording.get("media_shortcuts") or _EMPTY).get("transcript") or _EMPTY
+
+        meeting_url = get("meeting_url", "")
         if isinstance(meeting_url, dict):
             meeting_url = meeting_url.get("url", "")
 
         return cls(
             id=data["id"],
             meeting_url=meeting_url,
-            bot_name=data.get("bot_name", ""),
-            status=data.get("status", "unknown"),
+            bot_name=get("bot_name", ""),
+            status=get("status", "unknown"),
             project_id=metadata.get("project_id"),
             recurring_meeting_id=metadata.get("recurring_meeting_id"),
-            created_at=created_at,
+            created_at=_parse_created_at(get("created_at")),
             recording_id=recording.get("id"),
             transcript_url=transcript_info.get("download_url"),
         )
 
 
+@dataclass(frozen=True, slots=True)
+class _MediaUrls:
+    """Download URLs for a bot's recording artifacts."""
+    transcript_url: str | None
+    speaker_timeline_url: str | None
+    participant_events_url: str | None
+
+
 class RecallClient:
     """Async client for Recall.ai API."""
 
-    __slots__ = ("_settings", "_base_url")
+    __slots__ = ("_settings", "_base_url", "_default_headers", "_client", "_download_client", "_api_slots", "_bots", "_media_urls")
 
     def __init__(self):
         self._settings = get_settings()
         self._base_url = f"https://{self._settings.recall_region}.recall.ai/api/v1"
-
-    def _headers(self) -> dict:
-        return {
+        self._default_headers = {
             "Authorization": f"Token {self._settings.recall_api_key}",
             "Content-Type": "application/json",
         }
+        # Pooled keep-alive connections to the API, reused across calls
+        self._client = httpx.AsyncClient(
+            base_url=self._base_url,
+            headers=self._default_headers,
+            timeout=30.0,
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+        )
+        # Media download URLs point at object storage: no API auth, longer timeout
+        self._download_client = httpx.AsyncClient(timeout=60.0, http2=HTTP2_AVAILABLE)
+        # Bounds API calls from every caller (pagination, RAG syncs, webhooks) together
+        self._api_slots = asyncio.Semaphore(max(1, self._settings.recall_max_concurrency))
+        # bot_id -> (expiry, value); insertion ordered, so the first entry is the oldest
+        self._bots: dict[str, tuple[float, BotInfo]] = {}
+        self._media_urls: dict[str, tuple[float, _MediaUrls]] = {}
+
+    async def aclose(self) -> None:
+        """Close pooled connections."""
+        await self._client.aclose()
+        await self._download_client.aclose()
+
+    async def _request(self, method: str, path: str, **kwargs) -> httpx.Response:
+        """Send an API request once a concurrency slot is free, raising on error status."""
+        async with self._api_slots:
+            response = await self._client.request(method, path, **kwargs)
+        response.raise_for_status()
+        return response
+
+    async def _post_json(self, path: str, payload: dict) -> dict:
+        """POST an orjson-encoded payload and return the decoded response."""
+        # Content-Type comes from the client's default headers
+        response = await self._request("POST", path, content=orjson.dumps(payload))
+        return orjson.loads(response.content)
 
     async def create_bot(
         self,
@@ -101,38 +181,22 @@ class RecallClient:
             "meeting_url": meeting_url,
             "bot_name": bot_name,
             "metadata": metadata,
-            "recording_config": {
-                "transcript": {
-                    "provider": {
-                        "recallai_streaming": {
-                            "mode": "prioritize_low_latency",
-                            "language_code": "en",
-                        }
-                    },
-                    "diarization": {
-                        "use_separate_streams_when_available": True,
-                    },
-                },
-            },
-            "automatic_leave": {
-                "waiting_room_timeout": 600,
-                "noone_joined_timeout": 600,
-                "everyone_left_timeout": 3,
-                "silence_detection": {
-                    "timeout": 3600,
-                    "activate_after": 300,
-                },
-            },
+            "recording_config": _RECORDING_CONFIG,
+            "automatic_leave": _AUTOMATIC_LEAVE,
         }
 
         if realtime_transcript_url:
-            payload["recording_config"]["realtime_endpoints"] = [
-                {
-                    "type": "webhook",
-                    "url": realtime_transcript_url,
-                    "events": ["transcript.data", "speaker.update"],
-                }
-            ]
+            # Shallow copy: only the top level of the shared template gains a key
+            payload["recording_config"] = {
+                **_RECORDING_CONFIG,
+                "realtime_endpoints": [
+                    {
+                        "type": "webhook",
+                        "url": realtime_transcript_url,
+                        "events": ["transcript.data", "speaker.update"],
+                    }
+                ],
+            }
 
         if output_media_url:
             payload["output_media"] = {
@@ -144,24 +208,20 @@ class RecallClient:
                 "on_bot_join": {"message": chat_on_join, "send_to": "everyone"}
             }
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self._base_url}/bot/",
-                headers=self._headers(),
-                json=payload,
-            )
-            response.raise_for_status()
-            return BotInfo.from_api(response.json())
+        return BotInfo.from_api(await self._post_json("/bot/", payload))
 
     async def get_bot(self, bot_id: str) -> BotInfo:
         """Get current bot status."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self._base_url}/bot/{bot_id}/",
-                headers=self._headers(),
-            )
-            response.raise_for_status()
-            return BotInfo.from_api(response.json())
+        bot = _cache_get(self._bots, bot_id)
+        if bot is not None:
+            return bot
+
+        response = await self._request("GET", f"/bot/{bot_id}/")
+        bot = BotInfo.from_api(orjson.loads(response.content))
+
+        ttl = BOT_TERMINAL_TTL_SEC if bot.status in TERMINAL_BOT_STATUSES else BOT_LIVE_TTL_SEC
+        _cache_put(self._bots, bot_id, bot, ttl)
+        return bot
 
     async def list_bots(
         self,
@@ -171,6 +231,17 @@ class RecallClient:
         cursor: str | None = None,
     ) -> tuple[list[BotInfo], str | None]:
         """List bots with optional metadata filters."""
+        results, cursor = await self._list_bot_page(project_id, recurring_meeting_id, limit, cursor)
+        return [BotInfo.from_api(b) for b in results], cursor
+
+    async def _list_bot_page(
+        self,
+        project_id: str | None = None,
+        recurring_meeting_id: str | None = None,
+        limit: int = 100,
+        cursor: str | None = None,
+    ) -> tuple[list[dict], str | None]:
+        """Fetch one page of raw bot objects and the next page's cursor."""
         params = {"limit": limit}
         if project_id:
             params["metadata__project_id"] = project_id
@@ -179,41 +250,53 @@ class RecallClient:
         if cursor:
             params["cursor"] = cursor
 
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self._base_url}/bot/",
-                headers=self._headers(),
-                params=params,
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            bots = [BotInfo.from_api(b) for b in data.get("results", [])]
-            return bots, data.get("next")
-
-    async def iter_project_bots(self, project_id: str) -> AsyncIterator[BotInfo]:
+        response = await self._request("GET", "/bot/", params=params)
+        data = orjson.loads(response.content)
+        return data.get("results", []), data.get("next")
+
+    async def _iter_bot_pages(self, **filters) -> AsyncIterator[list[dict]]:
+        """Iterate raw pages of bots matching filters, fetching the next page while this one is consumed.
+
+        Cursors only arrive with each page, so pages can't be fanned out; instead one
+        request is always kept in flight ahead of the consumer.
+        """
+        page, cursor = await self._list_bot_page(**filters)
+        next_page: asyncio.Task | None = None
+        try:
+            while True:
+                if cursor:
+                    next_page = asyncio.create_task(self._list_bot_page(cursor=cursor, **filters))
+                yield page
+                if not cursor:
+                    break
+                page, cursor = await next_page
+        finally:
+            if next_page is not None:
+                next_page.cancel()
+
+    async def _iter_bots(self, **filters) -> AsyncIterator[BotInfo]:
+        """Iterate all bots matching filters."""
+        async for page in self._iter_bot_pages(**filters):
+            for data in page:
+                yield BotInfo.from_api(data)
+
+    async def iter_project_bot_summaries(self, project_id: str) -> AsyncIterator[dict]:
+        """Iterate a project's bots as the few fields listings show, skipping BotInfo."""
+        async for page in self._iter_bot_pages(project_id=project_id):
+            for data in page:
+                yield _bot_summary(data)
+
+    def iter_project_bots(self, project_id: str) -> AsyncIterator[BotInfo]:
         """Iterate all bots for a project."""
-        cursor = None
-        while True:
-            bots, cursor = await self.list_bots(project_id=project_id, cursor=cursor)
-            for bot in bots:
-                yield bot
-            if not cursor:
-                break
+        return self._iter_bots(project_id=project_id)
 
     async def list_project_bots(self, project_id: str) -> list[BotInfo]:
         """Get all bots for a project."""
         return [bot async for bot in self.iter_project_bots(project_id)]
 
-    async def iter_recurring_meeting_bots(self, recurring_meeting_id: str) -> AsyncIterator[BotInfo]:
+    def iter_recurring_meeting_bots(self, recurring_meeting_id: str) -> AsyncIterator[BotInfo]:
         """Iterate all bots for a recurring meeting series."""
-        cursor = None
-        while True:
-            bots, cursor = await self.list_bots(recurring_meeting_id=recurring_meeting_id, cursor=cursor)
-            for bot in bots:
-                yield bot
-            if not cursor:
-                break
+        return self._iter_bots(recurring_meeting_id=recurring_meeting_id)
 
     async def list_recurring_meeting_bots(self, recurring_meeting_id: str) -> list[BotInfo]:
         """Get all bots for a recurring meeting series."""
@@ -221,12 +304,7 @@ class RecallClient:
 
     async def remove_bot(self, bot_id: str) -> None:
         """Remove bot from meeting."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self._base_url}/bot/{bot_id}/leave_call/",
-                headers=self._headers(),
-            )
-            response.raise_for_status()
+        await self._request("POST", f"/bot/{bot_id}/leave_call/")
 
     async def send_chat_message(
         self,
@@ -235,117 +313,207 @@ class RecallClient:
         send_to: str = "everyone",
     ) -> dict:
         """Send a chat message from the bot."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.post(
-                f"{self._base_url}/bot/{bot_id}/send_chat_message/",
-                headers=self._headers(),
-                json={"message": message, "to": send_to},
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._post_json(
+            f"/bot/{bot_id}/send_chat_message/",
+            {"message": message, "to": send_to},
+        )
 
     async def get_recording(self, recording_id: str) -> dict:
         """Get recording details."""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                f"{self._base_url}/recording/{recording_id}/",
-                headers=self._headers(),
-            )
-            response.raise_for_status()
-            return response.json()
+        response = await self._request("GET", f"/recording/{recording_id}/")
+        return orjson.loads(response.content)
+
+    async def _resolve_media_urls(self, bot_id: str) -> _MediaUrls | None:
+        """Look up a bot's media download URLs, from cache or via the bot and its recording."""
+        urls = _cache_get(self._media_urls, bot_id)
+        if urls is not None:
+            return urls
 
-    async def get_speaker_timeline(self, bot_id: str) -> list[dict] | None:
-        """Get speaker timeline for a completed meeting."""
         bot = await self.get_bot(bot_id)
         if not bot.recording_id:
             return None
 
         recording = await self.get_recording(bot.recording_id)
         media_shortcuts = recording.get("media_shortcuts", {})
-        speaker_data = media_shortcuts.get("speaker_timeline", {})
-        download_url = speaker_data.get("download_url")
+        urls = _MediaUrls(
+            transcript_url=bot.transcript_url,
+            speaker_timeline_url=media_shortcuts.get("speaker_timeline", {}).get("download_url"),
+            participant_events_url=(
+                media_shortcuts.get("participant_events", {})
+                .get("data", {})
+                .get("participant_events_download_url")
+            ),
+        )
+
+        _cache_put(self._media_urls, bot_id, urls, MEDIA_URL_TTL_SEC)
+        return urls
+
+    def invalidate_bot(self, bot_id: str) -> None:
+        """Forget cached lookups for a bot (e.g. after its status changes)."""
+        self._bots.pop(bot_id, None)
+        self._media_urls.pop(bot_id, None)
+
+    async def get_speaker_timeline(self, bot_id: str) -> list[dict] | None:
+        """Get speaker timeline for a completed meeting."""
+        urls = await self._resolve_media_urls(bot_id)
+        download_url = urls.speaker_timeline_url if urls else None
 
         if not download_url:
             return None
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(download_url)
-            response.raise_for_status()
-            return response.json()
+        response = await self._download_client.get(download_url)
+        response.raise_for_status()
+        return orjson.loads(response.content)
 
     async def get_participant_events(self, bot_id: str) -> list[dict] | None:
         """Get participant events including chat messages."""
-        bot = await self.get_bot(bot_id)
-        if not bot.recording_id:
-            return None
-
-        recording = await self.get_recording(bot.recording_id)
-        media_shortcuts = recording.get("media_shortcuts", {})
-        events_data = media_shortcuts.get("participant_events", {}).get("data", {})
-        download_url = events_data.get("participant_events_download_url")
+        urls = await self._resolve_media_urls(bot_id)
+        download_url = urls.participant_events_url if urls else None
 
         if not download_url:
             return None
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(download_url)
-            response.raise_for_status()
-            return response.json()
+        return [e async for e in self._iter_download(download_url)]
 
     async def get_chat_messages(self, bot_id: str) -> list[dict]:
         """Extract chat messages from participant events."""
-        events = await self.get_participant_events(bot_id)
-        if not events:
+        urls = await self._resolve_media_urls(bot_id)
+        download_url = urls.participant_events_url if urls else None
+        if not download_url:
             return []
 
+        # Filter while the events download is parsed; most events aren't chat
         return [
             {
                 "participant": e.get("participant", {}),
                 "message": e.get("data", {}).get("message", ""),
                 "timestamp": e.get("timestamp"),
             }
-            for e in events
+            async for e in self._iter_download(download_url)
             if e.get("type") == "chat_message"
         ]
 
-    async def fetch_transcript(self, transcript_url: str) -> list[TranscriptUtterance]:
-        """Fetch and parse transcript from download URL."""
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.get(transcript_url)
-            response.raise_for_status()
-            data = response.json()
-
-        utterances = []
-        for item in data:
-            speaker = item.get("participant", {}) or {}
-            words = item.get("words", [])
+    async def _iter_download(self, download_url: str) -> AsyncIterator[dict]:
+        """Yield the items of the JSON array at a media download URL.
 
-            if not words:
-                continue
-
-            text = " ".join(w.get("text", "") for w in words).strip()
-            if not text:
-                continue
+        With ijson installed the body is parsed as it streams in, so a large download
+        never sits in memory as one parsed tree.
+        """
+        if ijson is None:
+            response = await self._download_client.get(download_url)
+            response.raise_for_status()
+            for item in orjson.loads(response.content):
+                yield item
+            return
 
-            start_time = words[0].get("start_timestamp", {}).get("relative", 0.0)
-            end_time = words[-1].get("end_timestamp", {}).get("relative")
+        async with self._download_client.stream("GET", download_url) as response:
+            response.raise_for_status()
+            async for item in ijson.items(_ByteStreamReader(response), "item", use_float=True):
+                yield item
 
-            utterances.append(TranscriptUtterance(
-                speaker_id=speaker.get("id", 0),
-                speaker_name=speaker.get("name"),
-                text=text,
-                start_time=start_time,
-                end_time=end_time,
-            ))
+    async def iter_transcript(self, transcript_url: str) -> AsyncIterator[TranscriptUtterance]:
+        """Yield utterances from a transcript download URL as it is parsed."""
+        async for item in self._iter_download(transcript_url):
+            if utterance := _parse_utterance(item):
+                yield utterance
 
-        return utterances
+    async def fetch_transcript(self, transcript_url: str) -> list[TranscriptUtterance]:
+        """Fetch and parse transcript from download URL."""
+        return [u async for u in self.iter_transcript(transcript_url)]
 
     async def get_bot_transcript(self, bot_id: str) -> list[TranscriptUtterance] | None:
         """Get transcript for a bot if available."""
-        bot = await self.get_bot(bot_id)
-        if not bot.transcript_url:
+        # The transcript URL is on the bot itself; only reuse a cached lookup, never add a hop
+        urls = _cache_get(self._media_urls, bot_id)
+        transcript_url = urls.transcript_url if urls else (await self.get_bot(bot_id)).transcript_url
+        if not transcript_url:
             return None
-        return await self.fetch_transcript(bot.transcript_url)
+        return await self.fetch_transcript(transcript_url)
+
+
+def _parse_created_at(value) -> datetime | None:
+    """Parse an API timestamp; None if missing or malformed."""
+    if not value:
+        return None
+    try:
+        # Python 3.11+ parses the trailing "Z" itself
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _bot_summary(data: dict) -> dict:
+    """Project a raw bot object onto the fields bot listings return."""
+    get = data.get
+    meeting_url = get("meeting_url", "")
+    if isinstance(meeting_url, dict):
+        meeting_url = meeting_url.get("url", "")
+    recording = get("recording") or _EMPTY
+    transcript_info = (recording.get("media_shortcuts") or _EMPTY).get("transcript") or _EMPTY
+    created_at = _parse_created_at(get("created_at"))
+
+    return {
+        "id": data["id"],
+        "status": get("status", "unknown"),
+        "meeting_url": meeting_url,
+        "recurring_meeting_id": (get("metadata") or _EMPTY).get("recurring_meeting_id"),
+        "created_at": created_at.isoformat() if created_at else None,
+        "has_transcript": transcript_info.get("download_url") is not None,
+    }
+
+
+def _cache_get(cache: dict, key: str):
+    """Return an unexpired cached value, or None."""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    expires_at, value = entry
+    if expires_at < time.monotonic():
+        del cache[key]
+        return None
+    return value
+
+
+def _cache_put(cache: dict, key: str, value, ttl: float) -> None:
+    """Cache a value for ttl seconds, evicting the oldest entry when full."""
+    cache.pop(key, None)
+    if len(cache) >= LOOKUP_CACHE_MAX:
+        del cache[next(iter(cache))]
+    cache[key] = (time.monotonic() + ttl, value)
+
+
+class _ByteStreamReader:
+    """Async file-like view of a streamed response body, as ijson reads it."""
+
+    __slots__ = ("_chunks",)
+
+    def __init__(self, response: httpx.Response):
+        self._chunks = response.aiter_bytes()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:  # ijson probes the stream type with an empty read
+            return b""
+        return await anext(self._chunks, b"")
+
+
+def _parse_utterance(item: dict) -> TranscriptUtterance | None:
+    """Build an utterance from one transcript entry, or None if it has no words."""
+    words = item.get("words")
+    if not words:
+        return None
+
+    text = " ".join([w.get("text", "") for w in words]).strip()
+    if not text:
+        return None
+
+    speaker = item.get("participant") or _EMPTY
+    return TranscriptUtterance(
+        speaker_id=speaker.get("id", 0),
+        speaker_name=speaker.get("name"),
+        text=text,
+        start_time=(words[0].get("start_timestamp") or _EMPTY).get("relative", 0.0),
+        end_time=(words[-1].get("end_timestamp") or _EMPTY).get("relative"),
+    )
 
 
 _client: RecallClient | None = None
@@ -357,3 +525,11 @@ def get_recall_client() -> RecallClient:
     if _client is None:
         _client = RecallClient()
     return _client
+
+
+async def close_recall_client() -> None:
+    """Close the shared Recall client's connections, if it was created."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
@@ -1,5 +1,7 @@
 """Bot management endpoints."""
 import logging
+from functools import lru_cache
+from urllib.parse import urlencode, urlsplit
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
@@ -8,12 +10,19 @@ from server.config import get_settings
 from server.constants import DEFAULT_JOIN_MESSAGE
 from server.models import BotCreateRequest, BotCreateResponse
 from server.recall import get_recall_client
-from server.state import active_bots, active_handlers, project_handlers
+from server.state import registry
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/api/bot", tags=["bots"])
 
 
+@lru_cache
+def _ws_host(server_url: str) -> str:
+    """Server URL without its scheme, as the output media page expects for ws_host."""
+    parts = urlsplit(server_url if "//" in server_url else f"//{server_url}")
+    return parts.netloc + parts.path.rstrip("/")
+
+
 @router.post("", response_model=BotCreateResponse)
 async def create_bot(request: BotCreateRequest):
     """Create a Recall bot and dispatch it to a meeting."""
@@ -21,11 +30,10 @@ async def create_bot(request: BotCreateRequest):
         settings = get_settings()
         client = get_recall_client()
 
-        server_ws = settings.server_url.replace("http://", "").replace("https://", "")
-        output_url = f"{settings.client_url}?project_id={request.project_id}&ws_host={server_ws}"
-
+        params = {"project_id": request.project_id, "ws_host": _ws_host(settings.server_url)}
         if request.recurring_meeting_id:
-            output_url += f"&recurring_meeting_id={request.recurring_meeting_id}"
+            params["recurring_meeting_id"] = request.recurring_meeting_id
+        output_url = f"{settings.client_url}?{urlencode(params)}"
 
         transcript_webhook_url = f"{settings.server_url}/webhooks/recall/transcript"
 
@@ -39,13 +47,10 @@ async def create_bot(request: BotCreateRequest):
             chat_on_join=DEFAULT_JOIN_MESSAGE,
         )
 
-        active_bots[request.project_id] = bot.id
-
         # If handler already connected (race condition), update it with bot_id
-        handler = project_handlers.get(request.project_id)
+        handler = registry.bind_bot(request.project_id, bot.id)
         if handler:
             handler._state.bot_id = bot.id
-            active_handlers[bot.id] = handler
 
         return BotCreateResponse(
             bot_id=bot.id,
@@ -54,9 +59,9 @@ async def create_bot(request: BotCreateRequest):
             recurring_meeting_id=request.recurring_meeting_id,
             status=bot.status,
         )
-    except Exception as e:
-        logger.error(f"Bot creation failed: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        logger.exception("Bot creation failed for project %s", request.project_id)
+        raise HTTPException(status_code=500, detail="Internal error")
 
 
 @router.get("/{bot_id}")
@@ -73,8 +78,9 @@ async def get_bot(bot_id: str):
             "meeting_url": bot.meeting_url,
             "has_transcript": bot.transcript_url is not None,
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        logger.exception("Failed to get bot %s", bot_id)
+        raise HTTPException(status_code=500, detail="Internal error")
 
 
 class ChatMessageRequest(BaseModel):
@@ -93,8 +99,9 @@ async def send_chat_message(bot_id: str, request: ChatMessageRequest):
             send_to=request.send_to,
         )
         return {"status": "sent", "result": result}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        logger.exception("Failed to send chat message from bot %s", bot_id)
+        raise HTTPException(status_code=500, detail="Internal error")
 
 
 @router.post("/{bot_id}/leave")
@@ -104,8 +111,9 @@ async def remove_bot(bot_id: str):
         client = get_recall_client()
         await client.remove_bot(bot_id)
         return {"status": "removed", "bot_id": bot_id}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        logger.exception("Failed to remove bot %s", bot_id)
+        raise HTTPException(status_code=500, detail="Internal error")
 
 
 @router.get("/{bot_id}/speaker-timeline")
@@ -119,8 +127,9 @@ async def get_speaker_timeline(bot_id: str):
         return {"bot_id": bot_id, "events": timeline}
     except HTTPException:
         raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        logger.exception("Failed to get speaker timeline for bot %s", bot_id)
+        raise HTTPException(status_code=500, detail="Internal error")
 
 
 @router.get("/{bot_id}/chat-history")
@@ -130,5 +139,6 @@ async def get_chat_history(bot_id: str):
         client = get_recall_client()
         messages = await client.get_chat_messages(bot_id)
         return {"bot_id": bot_id, "messages": messages}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        logger.exception("Failed to get chat history for bot %s", bot_id)
+        raise HTTPException(status_code=500, detail="Internal error")
@@ -17,24 +17,15 @@ async def list_project_bots(project_id: str):
     """List all bots for this project."""
     try:
         client = get_recall_client()
-        bots = await client.list_project_bots(project_id)
+        bots = [b async for b in client.iter_project_bot_summaries(project_id)]
         return {
             "project_id": project_id,
             "count": len(bots),
-            "bots": [
-                {
-                    "id": b.id,
-                    "status": b.status,
-                    "meeting_url": b.meeting_url,
-                    "recurring_meeting_id": b.recurring_meeting_id,
-                    "created_at": b.created_at.isoformat() if b.created_at else None,
-                    "has_transcript": b.transcript_url is not None,
-                }
-                for b in bots
-            ],
+            "bots": bots,
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        logger.exception("Failed to list bots for project %s", project_id)
+        raise HTTPException(status_code=500, detail="Internal error")
 
 
 @router.get("/context")
@@ -65,15 +56,16 @@ async def query_context(
                 {
                     "text": r.text,
                     "meeting_title": r.meeting_title,
-                    "meeting_date": r.meeting_date.isoformat(),
+                    "meeting_date": r.meeting_date,
                     "similarity": r.similarity,
                 }
                 for r in results
             ],
             "context": engine.format_context(results),
         }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        logger.exception("Context query failed for %s", recurring_meeting_id)
+        raise HTTPException(status_code=500, detail="Internal error")
 
 
 @router.post("/sync")
@@ -89,8 +81,9 @@ async def sync_project(
 
         result = await engine.sync_index()
         return {"project_id": project_id, "recurring_meeting_id": recurring_meeting_id, **result}
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        logger.exception("Sync failed for %s", recurring_meeting_id)
+        raise HTTPException(status_code=500, detail="Internal error")
 
 
 @router.get("/action-items")
@@ -112,8 +105,9 @@ async def list_action_items(project_id: str, status: str | None = None):
         }
     except HTTPException:
         raise
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        logger.exception("Failed to list action items for project %s", project_id)
+        raise HTTPException(status_code=500, detail="Internal error")
 
 
 @router.post("/action-items/{item_id}/complete")
@@ -1,16 +1,32 @@
 """Recall.ai webhook handlers."""
+import asyncio
 import logging
+from typing import TYPE_CHECKING
 
 from fastapi import APIRouter
 
 from server.constants import CHAT_REMOVE_COMMANDS
-from server.rag.engine import get_rag_engine
-from server.recall import get_recall_client
-from server.state import active_handlers, project_handlers
+from server.rag.engine import get_rag_engine, RAGEngine
+from server.recall import get_recall_client, RecallClient
+from server.state import registry
+
+if TYPE_CHECKING:
+    from server.websocket_handler import OutputMediaHandler
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/webhooks/recall", tags=["webhooks"])
 
+# A handler's delivery task exits after this long without transcripts
+TRANSCRIPT_DELIVERY_IDLE_SEC = 60.0
+
+# Maps handler -> queue of (speaker, text) awaiting delivery
+_transcript_queues: dict["OutputMediaHandler", asyncio.Queue] = {}
+
+# Work scheduled after a webhook returns: referenced until done, bounded while running
+BACKGROUND_TASK_LIMIT = 64
+_background_tasks: set[asyncio.Task] = set()
+_background_slots = asyncio.Semaphore(BACKGROUND_TASK_LIMIT)
+
 
 @router.post("/")
 async def recall_webhook(payload: dict):
@@ -23,20 +39,23 @@ async def recall_webhook(payload: dict):
         recurring_meeting_id = metadata.get("recurring_meeting_id")
 
         if event in ("bot.status_change", "transcript.done"):
+            if bot_id:
+                get_recall_client().invalidate_bot(bot_id)
             status = data.get("status", "")
             if event == "transcript.done" or status == "done":
                 if recurring_meeting_id:
                     engine = get_rag_engine(recurring_meeting_id)
                     if engine:
-                        result = await engine.sync_index()
-                        return {"status": "indexed", **result}
+                        # Respond before Recall's webhook timeout; indexing can take a while
+                        _spawn(_sync_index(engine))
+                        return {"status": "scheduled"}
                 return {"status": "isolated"}
 
         return {"status": "acknowledged"}
 
-    except Exception as e:
-        logger.error(f"Webhook error: {e}")
-        return {"status": "error", "message": str(e)}
+    except Exception:
+        logger.exception("Webhook error")
+        return {"status": "error"}
 
 
 @router.post("/transcript")
@@ -49,9 +68,7 @@ async def recall_transcript_webhook(payload: dict):
         project_id = metadata.get("project_id")
 
         # Try bot_id first, fallback to project_id
-        handler = active_handlers.get(bot_id)
-        if not handler and project_id:
-            handler = project_handlers.get(project_id)
+        handler = registry.lookup(bot_id, project_id)
         if not handler:
             return {"status": "no_handler"}
 
@@ -63,11 +80,11 @@ async def recall_transcript_webhook(payload: dict):
         text = " ".join(w.get("text", "") for w in words)
         speaker = transcript.get("speaker", "Unknown")
 
-        await handler.receive_transcript(speaker=speaker, text=text, is_final=True)
-        return {"status": "forwarded"}
+        _enqueue_transcript(handler, speaker, text)
+        return {"status": "queued"}
 
-    except Exception as e:
-        logger.error(f"Transcript webhook error: {e}")
+    except Exception:
+        logger.exception("Transcript webhook error")
         return {"status": "error"}
 
 
@@ -83,27 +100,88 @@ async def recall_chat_webhook(payload: dict):
             return {"status": "ignored"}
 
         chat_data = data.get("data", {})
-        message = chat_data.get("message", "").strip().lower()
+        message = chat_data.get("message", "").strip().casefold()
         participant = data.get("participant", {})
         sender_name = participant.get("name", "Unknown")
 
         if message in CHAT_REMOVE_COMMANDS:
-            logger.info(f"Remove command from {sender_name}")
-            client = get_recall_client()
-
-            try:
-                await client.send_chat_message(
-                    bot_id=bot_id,
-                    message=f"Goodbye! Leaving as requested by {sender_name}.",
-                )
-            except Exception:
-                pass
-
-            await client.remove_bot(bot_id)
-            return {"status": "removed"}
+            logger.info("Remove command from %s", sender_name)
+            _spawn(_leave_meeting(get_recall_client(), bot_id, sender_name))
+            return {"status": "removing"}
 
         return {"status": "acknowledged"}
 
-    except Exception as e:
-        logger.error(f"Chat webhook error: {e}")
+    except Exception:
+        logger.exception("Chat webhook error")
         return {"status": "error"}
+
+
+def _enqueue_transcript(handler: "OutputMediaHandler", speaker: str, text: str) -> None:
+    """Queue a transcript chunk, starting the handler's delivery task if needed."""
+    queue = _transcript_queues.get(handler)
+    if queue is None:
+        queue = _transcript_queues[handler] = asyncio.Queue()
+        _spawn(_deliver_transcripts(handler, queue))
+    queue.put_nowait((speaker, text))
+
+
+async def _deliver_transcripts(handler: "OutputMediaHandler", queue: asyncio.Queue) -> None:
+    """Forward queued chunks to the handler in order, one final utterance each.
+
+    Everything queued by the time the task wakes is delivered in that one tick;
+    chunks are never merged, since utterance boundaries drive wake-word handling.
+    """
+    try:
+        while True:
+            try:
+                batch = [await asyncio.wait_for(queue.get(), TRANSCRIPT_DELIVERY_IDLE_SEC)]
+            except asyncio.TimeoutError:
+                if queue.empty():
+                    return
+                continue
+
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+
+            for speaker, text in batch:
+                try:
+                    await handler.receive_transcript(speaker=speaker, text=text, is_final=True)
+                except Exception:
+                    logger.exception("Transcript delivery error")
+    finally:
+        if _transcript_queues.get(handler) is queue:
+            del _transcript_queues[handler]
+
+
+def _spawn(coro) -> None:
+    """Run a coroutine in the background, keeping a reference until it finishes."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def _sync_index(engine: RAGEngine) -> None:
+    """Index newly finished meetings for a series."""
+    async with _background_slots:
+        try:
+            result = await engine.sync_index()
+            logger.info("Indexed %d transcripts for %s", result["indexed"], engine.recurring_meeting_id)
+        except Exception:
+            logger.exception("Background sync failed for %s", engine.recurring_meeting_id)
+
+
+async def _leave_meeting(client: RecallClient, bot_id: str, sender_name: str) -> None:
+    """Say goodbye in chat, then remove the bot. The message must go out before the bot leaves."""
+    async with _background_slots:
+        try:
+            await client.send_chat_message(
+                bot_id=bot_id,
+                message=f"Goodbye! Leaving as requested by {sender_name}.",
+            )
+        except Exception:
+            pass
+
+        try:
+            await client.remove_bot(bot_id)
+        except Exception:
+            logger.exception("Failed to remove bot %s", bot_id)
@@ -4,16 +4,61 @@ In-memory state for active sessions.
 Note: This is fine for a single-server demo. In production, use Redis or similar
 for shared state across multiple server instances.
 """
+from __future__ import annotations
+
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from server.websocket_handler import OutputMediaHandler
 
-# Maps project_id -> bot_id for the currently active bot
-active_bots: dict[str, str] = {}
 
-# Maps bot_id -> handler for forwarding transcripts from webhooks
-active_handlers: dict[str, "OutputMediaHandler"] = {}
+class HandlerRegistry:
+    """Active bots and the output media handlers that receive their transcripts.
+
+    Every method runs without awaiting, so each update is atomic on the event loop.
+    """
+
+    __slots__ = ("_bot_by_project", "_by_bot", "_by_project")
+
+    def __init__(self):
+        # project_id -> bot_id of the currently active bot
+        self._bot_by_project: dict[str, str] = {}
+        # bot_id -> handler, for forwarding transcripts from webhooks
+        self._by_bot: dict[str, OutputMediaHandler] = {}
+        # project_id -> handler, for when the bot_id isn't known yet
+        self._by_project: dict[str, OutputMediaHandler] = {}
+
+    def active_bot(self, project_id: str) -> str | None:
+        """bot_id of the project's active bot, if any."""
+        return self._bot_by_project.get(project_id)
+
+    def register(self, project_id: str, handler: OutputMediaHandler, bot_id: str | None = None) -> None:
+        """Register a connected handler by project, and by bot if known."""
+        self._by_project[project_id] = handler
+        if bot_id:
+            self._by_bot[bot_id] = handler
+
+    def unregister(self, project_id: str, handler: OutputMediaHandler, bot_id: str | None = None) -> None:
+        """Drop a disconnected handler, leaving entries a newer connection has taken over."""
+        if self._by_project.get(project_id) is handler:
+            del self._by_project[project_id]
+        if bot_id and self._by_bot.get(bot_id) is handler:
+            del self._by_bot[bot_id]
+
+    def bind_bot(self, project_id: str, bot_id: str) -> OutputMediaHandler | None:
+        """Record the project's active bot and index its connected handler by bot_id.
+
+        Returns the handler, if one connected before the bot was created.
+        """
+        self._bot_by_project[project_id] = bot_id
+        handler = self._by_project.get(project_id)
+        if handler is not None:
+            self._by_bot[bot_id] = handler
+        return handler
+
+    def lookup(self, bot_id: str | None = None, project_id: str | None = None) -> OutputMediaHandler | None:
+        """Find the handler for a bot, falling back to its project."""
+        return self._by_bot.get(bot_id) or self._by_project.get(project_id)
+
 
-# Maps project_id -> handler (for when bot_id isn't known yet due to race condition)
-project_handlers: dict[str, "OutputMediaHandler"] = {}
+registry = HandlerRegistry()
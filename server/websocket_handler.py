@@ -2,23 +2,53 @@
 from __future__ import annotations
 
 import asyncio
-import base64
-import json
+import contextlib
 import logging
-import time
-from dataclasses import dataclass, field
+import re
+import struct
+from dataclasses import dataclass, field, replace
 from collections import deque
+from itertools import islice
 from typing import Optional
 
+import numpy as np
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
-from server.constants import RESPONSE_DELAY_SEC, LEAVE_KEYWORDS, WAKE_WORDS
+from server.config import get_settings
+from server.constants import RESPONSE_DELAY_SEC, LEAVE_KEYWORDS, SMALL_TALK_WORDS, WAKE_WORDS, WAKE_WORDS_SET
 from server.models import WSMessageType
-from server.ai.responder import AIResponder
+from server.ai.responder import AIResponder, AIResponse, WAKE_CONFIRMATION_TEXT
 from server.rag.engine import get_rag_engine, RAGEngine
 
 logger = logging.getLogger(__name__)
 
+# Recent RAG lookups reused for near-duplicate follow-up queries (cosine similarity)
+QUERY_CACHE_SIZE = 32
+QUERY_CACHE_SIMILARITY = 0.95
+
+# Follow-ups this close to the last full search are re-ranked from its wider candidate set
+FOLLOWUP_CANDIDATES = 20
+FOLLOWUP_SIMILARITY = 0.9
+
+# How long the greeting waits for the startup sync to find new action items;
+# past this it goes out mentioning only the items already stored
+GREETING_SYNC_WAIT_SEC = 2.0
+
+# Final utterances kept per session; RAG queries use all of them, the thinking preview the last 3
+RECENT_UTTERANCES = 5
+
+# Binary audio frames: opcode byte, big-endian stream id, then the MP3 bytes
+AUDIO_FRAME_OPCODE = 0x01
+_AUDIO_FRAME_HEADER = struct.Struct(">BI")
+
+# Substring matchers for voice commands, one C-level scan each
+_WAKE_RE = re.compile("|".join(map(re.escape, WAKE_WORDS)))
+_LEAVE_RE = re.compile("|".join(map(re.escape, LEAVE_KEYWORDS)))
+
+# Punctuation stripped from words before small-talk classification
+_WORD_PUNCTUATION = ".,!?;:\"'"
+
 
 @dataclass
 class SessionState:
@@ -26,16 +56,23 @@ class SessionState:
     project_id: str
     recurring_meeting_id: Optional[str] = None
     bot_id: Optional[str] = None
-    utterances: deque = field(default_factory=lambda: deque(maxlen=10))
+    utterances: deque = field(default_factory=lambda: deque(maxlen=RECENT_UTTERANCES))
     is_processing: bool = False
-    last_utterance_time: float = 0.0
-    pending_response: bool = False
+    audio_streams: int = 0
+    thinking_enabled: bool = True  # Clients without a visualization opt out via set_capabilities
+    # Last full RAG search: its unit query embedding, candidates and their unit embeddings
+    last_query_embedding: Optional[np.ndarray] = None
+    last_candidates: list = field(default_factory=list)
+    last_candidate_vectors: Optional[np.ndarray] = None
 
 
 class OutputMediaHandler:
     """Handles a single output media WebSocket connection."""
 
-    __slots__ = ("_ws", "_state", "_rag", "_ai", "_lock")
+    __slots__ = (
+        "_ws", "_state", "_rag", "_ai", "_outgoing", "_sync_task", "_response_timer", "_response_task",
+        "_side_tasks", "_query_cache", "_query_cache_rows",
+    )
 
     def __init__(
         self,
@@ -52,21 +89,37 @@ class OutputMediaHandler:
         )
         self._rag: RAGEngine | None = get_rag_engine(recurring_meeting_id)
         self._ai = AIResponder()
-        self._lock = asyncio.Lock()
+        self._sync_task: asyncio.Task | None = None  # Startup index sync; awaited before retrieval
+        # Fires the pending response after RESPONSE_DELAY_SEC of silence
+        self._response_timer: asyncio.TimerHandle | None = None
+        self._response_task: asyncio.Task | None = None
+        # Wake confirmations and leave commands, run so transcript intake never waits on them
+        self._side_tasks: set[asyncio.Task] = set()
+        # JSON messages and binary frames for the writer task; None stops it.
+        # The writer is the only coroutine sending on the socket, so sends need no lock.
+        self._outgoing: asyncio.Queue[dict | bytes | None] = asyncio.Queue()
+        # (unit query embedding, context, results), least recently used first
+        self._query_cache: deque[tuple[np.ndarray, str | None, list]] = deque(maxlen=QUERY_CACHE_SIZE)
+        self._query_cache_rows = 0  # Index size the cached results were computed against
 
     async def handle(self) -> None:
         """Main connection handler."""
-        await self._ws.accept()
+        # Sync in the background; only the first retrieval has to wait for it
+        if self._rag:
+            self._sync_task = asyncio.create_task(self._sync_index())
 
+        # Prepare the greeting now so it overlaps the handshake and the sync
+        greeting = asyncio.create_task(self._prepare_greeting())
         try:
-            if self._rag:
-                await self._rag.sync_index()
-                action_context = self._rag.get_action_items_context()
-                if action_context:
-                    self._ai.set_action_items_context(action_context)
+            await self._ws.accept()
+        except BaseException:
+            greeting.cancel()
+            raise
+        writer = asyncio.create_task(self._writer())
 
+        try:
             await self._send_status("connected", "Recall connected")
-            await self._send_greeting()
+            await self._send_greeting(greeting)
             await self._receive_loop()
 
         except WebSocketDisconnect:
@@ -74,54 +127,73 @@ class OutputMediaHandler:
         except Exception as e:
             logger.exception(f"WebSocket error: {e}")
             await self._send_error(str(e))
+        finally:
+            if self._response_timer:
+                self._response_timer.cancel()
+            # Stop in-flight work before closing the queue, so nothing enqueues after the sentinel
+            pending = [t for t in (greeting, self._response_task, *self._side_tasks) if t and not t.done()]
+            for task in pending:
+                task.cancel()
+            for task in pending:
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+            self._outgoing.put_nowait(None)
+            await writer
 
     async def receive_transcript(self, speaker: str, text: str, is_final: bool) -> None:
-        """Process incoming transcript from client."""
-        self._state.utterances.append(text)
-        self._ai.add_user_message(speaker, text)
+        """Process incoming transcript from client.
 
+        Only updates state and schedules work, so callers delivering a stream of
+        transcripts never wait on TTS or the leave sequence.
+        """
+        # Partials are superseded by their final; only finals change session state
         if not is_final:
             return
 
-        if await self._check_voice_commands(text, speaker):
+        self._state.utterances.append(text)
+        self._ai.add_user_message(speaker, text)
+
+        if self._check_voice_commands(text, speaker):
             return
 
-        self._state.last_utterance_time = time.time()
+        # Anyone still talking pushes a pending response back
+        if self._response_timer:
+            self._schedule_response()
 
         if await self._ai.should_respond(text):
             if self._ai.is_awaiting_question():
-                await self._send_wake_confirmation()
+                self._spawn(self._send_wake_confirmation())
             else:
-                self._state.pending_response = True
-                asyncio.create_task(self._delayed_response_check())
+                self._schedule_response()
 
     async def _send_wake_confirmation(self) -> None:
-        """Send 'Yes?' confirmation when user says just the wake word."""
+        """Send 'Yes?' confirmation when user says just the wake word (its audio is kept in memory)."""
         await self._send_message(WSMessageType.TRANSCRIPT, {
             "speaker": "assistant",
-            "text": "Yes?",
+            "text": WAKE_CONFIRMATION_TEXT,
             "is_final": True,
         })
 
         try:
-            audio = await self._ai._generate_tts("Yes?")
-            if audio:
-                await self._send_audio(audio)
+            await self._stream_audio(WAKE_CONFIRMATION_TEXT)
         except Exception as e:
             logger.error(f"TTS error: {e}")
 
-    async def _check_voice_commands(self, text: str, speaker: str) -> bool:
-        """Check for voice commands. Returns True if command was handled."""
-        text_lower = text.lower().strip()
+    def _spawn(self, coro) -> None:
+        """Run side work in the background, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._side_tasks.add(task)
+        task.add_done_callback(self._side_tasks.discard)
 
-        is_awaiting = self._ai.is_awaiting_question()
-        has_wake_word = any(wake in text_lower for wake in WAKE_WORDS)
-        has_leave_keyword = any(kw in text_lower for kw in LEAVE_KEYWORDS)
+    def _check_voice_commands(self, text: str, speaker: str) -> bool:
+        """Check for voice commands. Returns True if a command was scheduled."""
+        text_lower = text.lower().strip()
 
-        if has_leave_keyword and (has_wake_word or is_awaiting):
+        # Most utterances have no leave keyword, so only those get the wake-word scan
+        if _LEAVE_RE.search(text_lower) and (self._ai.is_awaiting_question() or _WAKE_RE.search(text_lower)):
             logger.info(f"Leave command from {speaker}")
             self._ai.clear_awaiting()
-            await self._handle_leave_command(speaker)
+            self._spawn(self._handle_leave_command(speaker))
             return True
 
         return False
@@ -129,7 +201,7 @@ class OutputMediaHandler:
     async def _handle_leave_command(self, speaker: str) -> None:
         """Handle request to leave the meeting."""
         from server.recall import get_recall_client
-        from server.state import active_bots
+        from server.state import registry
 
         goodbye_text = f"Goodbye everyone! {speaker} asked me to leave. Feel free to invite me back anytime."
 
@@ -140,19 +212,17 @@ class OutputMediaHandler:
         })
 
         try:
-            audio = await self._ai._generate_tts(goodbye_text)
-            if audio:
-                await self._send_audio(audio)
+            if await self._stream_audio(goodbye_text):
                 await asyncio.sleep(3)
         except Exception as e:
             logger.error(f"TTS error: {e}")
 
-        # Get bot_id - try state first, then fallback to active_bots lookup
+        # Get bot_id - try state first, then fallback to the project's active bot
         bot_id = self._state.bot_id
         if not bot_id:
-            bot_id = active_bots.get(self._state.project_id)
+            bot_id = registry.active_bot(self._state.project_id)
             if bot_id:
-                logger.info(f"bot_id not in state, found in active_bots: {bot_id}")
+                logger.info(f"bot_id not in state, found active bot: {bot_id}")
 
         if bot_id:
             try:
@@ -164,15 +234,27 @@ class OutputMediaHandler:
         else:
             logger.error(f"Cannot leave - no bot_id for project {self._state.project_id}")
 
-    async def _delayed_response_check(self) -> None:
-        """Wait for silence before responding."""
-        await asyncio.sleep(RESPONSE_DELAY_SEC + 0.1)
+    async def _sync_index(self) -> None:
+        """Sync the RAG index, then load pending action items (indexing may add some)."""
+        try:
+            await self._rag.sync_index()
+        except Exception as e:
+            logger.error(f"Index sync failed, using existing index: {e}")
 
-        time_since_last = time.time() - self._state.last_utterance_time
+        action_context = self._rag.get_action_items_context()
+        if action_context:
+            self._ai.set_action_items_context(action_context)
 
-        if time_since_last >= (RESPONSE_DELAY_SEC - 0.1) and self._state.pending_response:
-            self._state.pending_response = False
-            await self._generate_and_send_response()
+    def _schedule_response(self) -> None:
+        """(Re)start the silence timer for the pending response."""
+        if self._response_timer:
+            self._response_timer.cancel()
+        self._response_timer = asyncio.get_running_loop().call_later(RESPONSE_DELAY_SEC, self._respond)
+
+    def _respond(self) -> None:
+        """Silence timer callback: generate the pending response."""
+        self._response_timer = None
+        self._response_task = asyncio.create_task(self._generate_and_send_response())
 
     async def _generate_and_send_response(self) -> None:
         """Query RAG and generate AI response."""
@@ -182,39 +264,25 @@ class OutputMediaHandler:
         self._state.is_processing = True
 
         try:
-            query = " ".join(list(self._state.utterances)[-3:])
+            query = " ".join(self._recent_utterances(3))
 
             await self._send_thinking("processing", "Processing your question...", {
                 "query": query[:100] + ("..." if len(query) > 100 else ""),
             })
 
-            context, rag_results = await self._query_rag()
-
-            if self._rag:
-                if rag_results:
-                    await self._send_thinking("context", f"Found {len(rag_results)} relevant memories", {
-                        "query": query,
-                        "results": [
-                            {
-                                "text": r.text,
-                                "meeting": r.meeting_title,
-                                "date": r.meeting_date.strftime("%b %d, %Y"),
-                                "similarity": round(r.similarity, 2),
-                            }
-                            for r in rag_results
-                        ]
-                    })
-                else:
-                    await self._send_thinking("context", "No matching memories found", {
-                        "query": query,
-                        "results": [],
-                    })
-            else:
-                await self._send_thinking("context", "Memory disabled for this meeting", {})
+            retrieve = self._should_retrieve(self._state.utterances[-1] if self._state.utterances else "")
+            context, rag_results = await self._query_rag() if retrieve else (None, [])
+
+            # Action items found by the startup sync belong in the prompt
+            if self._sync_task:
+                await self._sync_task
+
+            if self._state.thinking_enabled:
+                await self._send_context_step(query, retrieve, rag_results)
 
             await self._send_thinking("generating", "Generating response...", {})
 
-            response = await self._ai.generate_response(include_audio=True)
+            response = await self._ai.generate_response()
 
             await self._send_thinking("complete", "Response ready", {})
 
@@ -224,8 +292,7 @@ class OutputMediaHandler:
                 "is_final": True,
             })
 
-            if response.audio:
-                await self._send_audio(response.audio)
+            await self._stream_audio(response.text)
 
         except Exception as e:
             logger.exception(f"Response generation error: {e}")
@@ -233,10 +300,34 @@ class OutputMediaHandler:
         finally:
             self._state.is_processing = False
 
-    async def _send_greeting(self) -> None:
-        """Generate and send initial greeting."""
-        has_items = bool(self._rag and self._rag.get_action_items_context())
-        response = await self._ai.generate_greeting(has_action_items=has_items)
+    async def _send_context_step(self, query: str, retrieved: bool, rag_results: list) -> None:
+        """Send the thinking step describing what memory lookup found."""
+        if not self._rag:
+            await self._send_thinking("context", "Memory disabled for this meeting", {})
+        elif not retrieved:
+            await self._send_thinking("context", "No memory lookup needed", {"query": query})
+        elif rag_results:
+            await self._send_thinking("context", f"Found {len(rag_results)} relevant memories", {
+                "query": query,
+                "results": [r.to_thinking_dict() for r in rag_results],
+            })
+        else:
+            await self._send_thinking("context", "No matching memories found", {
+                "query": query,
+                "results": [],
+            })
+
+    async def _prepare_greeting(self) -> AIResponse:
+        """Generate the greeting text, mentioning action items if any are pending."""
+        if self._sync_task:
+            # The sync may extract items from the latest meeting; wait a bounded time for it
+            await asyncio.wait((self._sync_task,), timeout=GREETING_SYNC_WAIT_SEC)
+        has_items = bool(self._rag and self._rag.has_pending_action_items())
+        return await self._ai.generate_greeting(has_action_items=has_items)
+
+    async def _send_greeting(self, greeting: asyncio.Task[AIResponse]) -> None:
+        """Send the initial greeting once its text is ready."""
+        response = await greeting
 
         await self._send_message(WSMessageType.TRANSCRIPT, {
             "speaker": "assistant",
@@ -244,15 +335,25 @@ class OutputMediaHandler:
             "is_final": True,
         })
 
-        if response.audio:
-            await self._send_audio(response.audio)
+        await self._stream_audio(response.text)
+
+    @staticmethod
+    def _should_retrieve(utterance: str) -> bool:
+        """Whether an utterance could use past-meeting context (not just thanks, yes, repeat...)."""
+        words = (word.strip(_WORD_PUNCTUATION) for word in utterance.lower().split())
+        return any(word and word not in WAKE_WORDS_SET and word not in SMALL_TALK_WORDS for word in words)
+
+    def _recent_utterances(self, n: int) -> list[str]:
+        """The last n utterances, oldest first."""
+        utterances = self._state.utterances
+        return list(islice(utterances, max(0, len(utterances) - n), None))
 
     async def _query_rag(self) -> tuple[str | None, list]:
         """Query RAG and update AI context."""
         if not self._rag:
             return None, []
 
-        recent = list(self._state.utterances)[-5:]
+        recent = list(self._state.utterances)
         query = " ".join(recent)
 
         # Expand short follow-up questions with conversation context
@@ -264,27 +365,81 @@ class OutputMediaHandler:
         if not query.strip():
             return None, []
 
-        results = await self._rag.query(query, auto_sync=False)
+        # The embedding call doesn't need the index, so it overlaps any unfinished startup sync
+        embedding_task = asyncio.create_task(self._rag.embed(query))
+        if self._sync_task:
+            try:
+                await self._sync_task
+            except BaseException:
+                embedding_task.cancel()
+                raise
+        embedding = await embedding_task
+        embedding = embedding / (np.linalg.norm(embedding) + 1e-10)
+
+        self._drop_stale_lookups()
+        cached = self._lookup_query_cache(embedding)
+        if cached is not None:
+            context, results = cached
+        else:
+            results = self._search(embedding)
+            context = self._rag.format_context(results) if results else None
+            self._query_cache.append((embedding, context, results))
 
-        if results:
-            context = self._rag.format_context(results)
+        if context:
             self._ai.set_context(context)
             return context, results
 
         return None, []
 
+    def _drop_stale_lookups(self) -> None:
+        """Forget cached lookups once new transcripts are indexed; they would miss them."""
+        rows = len(self._rag.cache)
+        if rows != self._query_cache_rows:
+            self._query_cache.clear()
+            self._state.last_query_embedding = None
+            self._query_cache_rows = rows
+
+    def _search(self, embedding: np.ndarray) -> list:
+        """Top results for a query, re-ranked locally when it closely follows the last search."""
+        settings = get_settings()
+        state = self._state
+
+        if state.last_query_embedding is not None and state.last_query_embedding @ embedding >= FOLLOWUP_SIMILARITY:
+            similarities = state.last_candidate_vectors @ embedding
+            order = [i for i in np.argsort(similarities)[::-1] if similarities[i] >= settings.rag_similarity_threshold]
+            if order:
+                return [
+                    replace(state.last_candidates[i], similarity=float(similarities[i]))
+                    for i in order[:settings.rag_top_k]
+                ]
+
+        candidates, vectors = self._rag.search_with_vectors(embedding, top_k=FOLLOWUP_CANDIDATES)
+        state.last_query_embedding = embedding
+        state.last_candidates = candidates
+        state.last_candidate_vectors = vectors
+        return candidates[:settings.rag_top_k]
+
+    def _lookup_query_cache(self, embedding: np.ndarray) -> tuple[str | None, list] | None:
+        """Return (context, results) cached for a near-identical query, if any."""
+        if not self._query_cache:
+            return None
+
+        keys = np.stack([entry[0] for entry in self._query_cache])
+        similarities = keys @ embedding
+        best = int(np.argmax(similarities))
+        if similarities[best] < QUERY_CACHE_SIMILARITY:
+            return None
+
+        entry = self._query_cache[best]
+        del self._query_cache[best]
+        self._query_cache.append(entry)  # Most recently used goes last
+        return entry[1], entry[2]
+
     async def _receive_loop(self) -> None:
-        """Process incoming WebSocket messages."""
+        """Process incoming WebSocket messages (the client only sends JSON text frames)."""
         while True:
             try:
-                msg = await self._ws.receive()
-
-                if msg["type"] == "websocket.disconnect":
-                    break
-
-                if "text" in msg:
-                    await self._handle_json(json.loads(msg["text"]))
-
+                await self._handle_json(orjson.loads(await self._ws.receive_text()))
             except WebSocketDisconnect:
                 break
 
@@ -302,39 +457,93 @@ class OutputMediaHandler:
         elif msg_type == "query" and self._rag:
             query = data.get("query", "")
             if query:
+                await self._sync_task
                 results = await self._rag.query(query, auto_sync=False)
                 context = self._rag.format_context(results)
                 await self._send_message(WSMessageType.CONTEXT, {"context": context})
 
+        elif msg_type == "set_capabilities":
+            self._state.thinking_enabled = bool(data.get("thinking", True))
+
         elif msg_type == "set_bot_id":
             bot_id = data.get("bot_id")
             if bot_id:
                 self._state.bot_id = bot_id
 
     async def _send_message(self, msg_type: WSMessageType, data: dict) -> None:
-        """Send JSON message to client."""
-        async with self._lock:
-            try:
-                await self._ws.send_json({"type": msg_type.value, "data": data})
-            except Exception:
-                pass
+        """Queue JSON message for the client."""
+        self._outgoing.put_nowait({"type": msg_type.value, "data": data})
 
-    async def _send_audio(self, audio_data: bytes) -> None:
-        """Send audio for playback."""
-        async with self._lock:
-            try:
-                await self._ws.send_json({
-                    "type": "audio",
-                    "data": {
-                        "audio": base64.b64encode(audio_data).decode("utf-8"),
-                        "format": "mp3",
-                    }
-                })
-            except Exception:
-                pass
+    async def _send_bytes(self, frame: bytes) -> None:
+        """Queue a binary frame for the client."""
+        self._outgoing.put_nowait(frame)
+
+    async def _writer(self) -> None:
+        """Send queued messages in order until stopped.
+
+        JSON messages queued back to back (e.g. the thinking steps of a turn) go
+        out together as one text frame holding a JSON array.
+        """
+        batch: list[dict] = []
+        while True:
+            item = await self._outgoing.get()
+            while True:
+                if isinstance(item, dict):
+                    batch.append(item)
+                else:
+                    if batch:
+                        await self._send_batch(batch)
+                        batch = []
+                    if item is None:
+                        return
+                    await self._send_frame(item)
+                if self._outgoing.empty():
+                    break
+                item = self._outgoing.get_nowait()
+            if batch:
+                await self._send_batch(batch)
+                batch = []
+
+    async def _send_batch(self, batch: list[dict]) -> None:
+        """Send queued JSON messages as one text frame."""
+        try:
+            await self._ws.send_text(orjson.dumps(batch[0] if len(batch) == 1 else batch).decode())
+        except Exception:
+            pass
+
+    async def _send_frame(self, frame: bytes) -> None:
+        """Send a binary frame."""
+        try:
+            await self._ws.send_bytes(frame)
+        except Exception:
+            pass
+
+    async def _stream_audio(self, text: str) -> bool:
+        """Synthesize text and forward audio chunks as the TTS API produces them.
+
+        Returns whether any audio was sent.
+        """
+        self._state.audio_streams += 1
+        stream_id = self._state.audio_streams
+
+        sent = False
+        header = _AUDIO_FRAME_HEADER.pack(AUDIO_FRAME_OPCODE, stream_id)
+        async for chunk in self._ai.stream_tts(text):
+            sent = True
+            await self._send_bytes(header + chunk)
+
+        # No audio (e.g. TTS failed) means no stream on the client to end
+        if sent:
+            await self._send_message(WSMessageType.AUDIO_CHUNK, {
+                "stream_id": stream_id,
+                "done": True,
+            })
+        return sent
 
     async def _send_thinking(self, step: str, message: str, data: dict = None) -> None:
-        """Send thinking/visualization event to client."""
+        """Send thinking/visualization event to client, unless it opted out."""
+        if not self._state.thinking_enabled:
+            return
         payload = {"step": step, "message": message}
         if data:
             payload["data"] = data
@@ -0,0 +1,98 @@
+"""Action item detection and journal persistence."""
+import pytest
+
+from server.config import get_settings
+from server.memory import action_items
+from server.memory.action_items import (
+    JOURNAL_BATCH_MAX,
+    ActionItemStore,
+    ActionPattern,
+    _ACTION_PATTERN,
+    _iter_matches,
+    detect_action_items,
+)
+from server.memory.persistence import get_action_items_journal_path, get_project_dir
+from server.models import ActionItemStatus
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point project storage at a temporary data directory."""
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    get_settings.cache_clear()
+    get_project_dir.cache_clear()
+    yield tmp_path
+    get_settings.cache_clear()
+    get_project_dir.cache_clear()
+
+
+def _items(n: int, offset: int = 0):
+    text = " ".join(f"Remind me to review draft number {i}." for i in range(offset, offset + n))
+    return list(detect_action_items(text, "proj", "bot-1"))
+
+
+def _reloaded() -> ActionItemStore:
+    store = ActionItemStore("proj")
+    store.load()
+    return store
+
+
+def test_journal_replays_small_saves(data_dir):
+    store = ActionItemStore("proj")
+    store.add_many(_items(3))
+    store.save()
+    first = next(iter(store))
+    store.complete(first.item_id)
+    store.save()
+
+    assert len(get_action_items_journal_path("proj").read_bytes().splitlines()) == 4
+
+    reloaded = _reloaded()
+    assert {item.item_id: item for item in reloaded} == {item.item_id: item for item in store}
+    assert reloaded.get(first.item_id).status == ActionItemStatus.COMPLETED
+    # Dedup survives the reload
+    assert reloaded.add_many(_items(3)) == 0
+
+
+def test_large_save_folds_journal_into_snapshot(data_dir):
+    store = ActionItemStore("proj")
+    store.add_many(_items(2))
+    store.save()
+    store.add_many(_items(JOURNAL_BATCH_MAX, offset=2))
+    store.save()
+
+    assert not get_action_items_journal_path("proj").exists()
+    assert {item.item_id: item for item in _reloaded()} == {item.item_id: item for item in store}
+
+
+def test_load_skips_torn_journal_line(data_dir):
+    store = ActionItemStore("proj")
+    store.add_many(_items(2))
+    store.save()
+    journal = get_action_items_journal_path("proj")
+    journal.write_bytes(journal.read_bytes() + b'{"op": "upsert", "item": {"item_')
+
+    assert len(_reloaded()) == 2
+
+
+TEXTS = [
+    "Remind me to send the budget. Also, let's revisit the hiring plan!",
+    "TODO: update the onboarding doc\nand follow up with Dana about the contract",
+    "remind me to remind me to check twice. action item: ship the release notes",
+    "Don't forget to book the room. dont forget the slides? Circle back on pricing",
+    "Nothing to see here, just a normal sentence about lunch.",
+    "follow up on x. todo fix",  # Action text too short to match
+    "Remind me about the launch " + "very " * 120 + "soon.",  # Longer than the capture bound
+]
+
+
+@pytest.mark.skipif(action_items.hyperscan is None, reason="hyperscan not installed")
+@pytest.mark.parametrize("text", TEXTS)
+def test_hyperscan_matches_equal_regex(text):
+    regex_only = ActionPattern(regex=_ACTION_PATTERN.regex, names=_ACTION_PATTERN.names)
+
+    def spans(pattern: ActionPattern) -> list[tuple]:
+        return [(m.span(), m.lastgroup, m.group(m.lastgroup)) for m in _iter_matches(pattern, text)]
+
+    assert _ACTION_PATTERN.triggers is not None
+    assert spans(_ACTION_PATTERN) == spans(regex_only)
@@ -0,0 +1,28 @@
+"""Webhook transcript delivery to session handlers."""
+import asyncio
+
+from server.routers import webhooks
+
+
+class RecordingHandler:
+    def __init__(self):
+        self.received = []
+
+    async def receive_transcript(self, speaker, text, is_final):
+        self.received.append((speaker, text, is_final))
+
+
+def test_chunks_are_delivered_in_order_without_merging():
+    async def run():
+        handler = RecordingHandler()
+        for speaker, text in [("Ann", "Recall"), ("Ann", "what's the budget"), ("Bob", "thanks")]:
+            webhooks._enqueue_transcript(handler, speaker, text)
+        for _ in range(5):
+            await asyncio.sleep(0)
+        return handler.received
+
+    assert asyncio.run(run()) == [
+        ("Ann", "Recall", True),
+        ("Ann", "what's the budget", True),
+        ("Bob", "thanks", True),
+    ]
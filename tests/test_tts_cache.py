@@ -0,0 +1,15 @@
+"""TTS disk cache writes."""
+from concurrent.futures import ThreadPoolExecutor
+
+from server.ai.responder import _write_atomic
+
+
+def test_concurrent_writes_never_leave_a_mixed_file(tmp_path):
+    path = tmp_path / "tts_cache" / "clip.mp3"
+    payloads = [bytes([i]) * 200_000 for i in range(8)]
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda data: _write_atomic(path, data), payloads * 4))
+
+    assert path.read_bytes() in payloads
+    assert list(path.parent.glob("*.tmp")) == []
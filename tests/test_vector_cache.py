@@ -0,0 +1,109 @@
+"""VectorCache search and persistence."""
+import os
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from server.config import get_settings
+from server.rag.engine import ChunkMeta, VectorCache
+
+
+@pytest.fixture
+def int8_settings(monkeypatch):
+    """Configure int8 embedding storage, which `VectorCache.load` reads from settings."""
+    monkeypatch.setenv("RAG_EMBEDDING_DTYPE", "int8")
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def _meta(n: int) -> list[ChunkMeta]:
+    return [
+        ChunkMeta(
+            bot_id=f"bot-{i % 3}",
+            text=f"chunk {i}",
+            meeting_title="Standup",
+            meeting_date=datetime(2024, 1, 1 + i % 28),
+            recurring_meeting_id="series",
+        )
+        for i in range(n)
+    ]
+
+
+def _filled_cache(dtype: str, n: int = 40, d: int = 16) -> VectorCache:
+    rng = np.random.default_rng(0)
+    cache = VectorCache("series", dtype=dtype)
+    cache.add_chunks(_meta(n), rng.normal(size=(n, d)).astype(np.float32))
+    cache.indexed_bots = {"bot-0", "bot-1", "bot-2"}
+    return cache
+
+
+@pytest.mark.parametrize("dtype", ["float32", "int8"])
+def test_search_with_vectors_on_empty_cache(dtype):
+    cache = VectorCache("empty-series", dtype=dtype)
+    query = np.ones(8, dtype=np.float32)
+
+    results, vectors = cache.search_with_vectors(query, top_k=20)
+
+    assert results == []
+    assert vectors.shape == (0, 8)
+    assert (vectors @ query).shape == (0,)
+
+
+@pytest.mark.parametrize("mmap", [False, True])
+def test_int8_round_trip_is_bit_identical(tmp_path, int8_settings, mmap):
+    cache = _filled_cache("int8")
+    n = len(cache)
+    rows, scales = cache._buffer[:n].copy(), cache._scales[:n].copy()
+    path = tmp_path / "vectors.json"
+
+    cache.save(path)
+    loaded = VectorCache.load("series", path, mmap=mmap)
+    np.testing.assert_array_equal(loaded._buffer[:n], rows)
+    np.testing.assert_array_equal(loaded._scales[:n], scales)
+
+    # A second save/load cycle must not add rounding error either
+    loaded.save(path)
+    reloaded = VectorCache.load("series", path, mmap=mmap)
+    np.testing.assert_array_equal(reloaded._buffer[:n], rows)
+    np.testing.assert_array_equal(reloaded._scales[:n], scales)
+    assert reloaded.meta == cache.meta
+    assert reloaded.indexed_bots == cache.indexed_bots
+
+
+def test_load_uses_fresh_snapshot(tmp_path, monkeypatch):
+    cache = _filled_cache("float32")
+    path = tmp_path / "vectors.json"
+    cache.save(path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("JSON parsed despite a fresh snapshot")
+
+    monkeypatch.setattr("server.rag.engine.orjson.loads", fail)
+    loaded = VectorCache.load("series", path)
+    assert loaded.meta == cache.meta
+    assert loaded.indexed_bots == cache.indexed_bots
+
+
+def test_load_ignores_snapshot_left_by_interrupted_save(tmp_path, monkeypatch):
+    path = tmp_path / "vectors.json"
+    _filled_cache("float32", n=40).save(path)
+
+    def crash(*args, **kwargs):
+        raise OSError("crash")
+
+    # Crash after the new sidecar and JSON are written, before the snapshot is
+    bigger = _filled_cache("float32", n=50)
+    with monkeypatch.context() as m:
+        m.setattr("server.rag.engine.pickle.dumps", crash)
+        with pytest.raises(OSError):
+            bigger.save(path)
+
+    # Coarse timestamps (or a checkout/copy) can leave the stale snapshot looking as new
+    snapshot_path = path.with_suffix(".pkl")
+    os.utime(snapshot_path, ns=(snapshot_path.stat().st_atime_ns, path.stat().st_mtime_ns))
+
+    loaded = VectorCache.load("series", path)
+    assert len(loaded) == 50
+    assert loaded.meta == bigger.meta